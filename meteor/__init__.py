@@ -0,0 +1,3 @@
+"""
+☄️ Meteorite Explorer - data layer & helpers
+"""
@@ -0,0 +1,191 @@
+"""
+Named chart queries: agregasi dijalankan di Postgres (view chart_*), fallback pandas lokal
+
+Setiap chart didefinisikan sekali di CHART_QUERIES. Dari definisi yang sama:
+  - view_sql()        -> CREATE VIEW untuk Supabase (lihat sql/chart_views.sql)
+  - aggregate_local() -> hasil identik dari DataFrame lokal (offline / view belum ada)
+
+Regenerasi file SQL:  python -m meteor.aggregates > sql/chart_views.sql
+"""
+
+import operator
+
+import pandas as pd
+
+# table    : tabel utama
+# joins    : {tabel_lookup: kolom_join} -> LEFT JOIN ... USING (kolom_join)
+# filters  : [(operator, kolom, nilai)]
+# group_by : kolom group (NULL dibuang, sama seperti value_counts())
+# measures : {nama_output: (fungsi, kolom)} ; fungsi = count/sum/avg/min/max
+# order_by : [(kolom, desc)]
+# limit    : jumlah baris maksimum
+CHART_QUERIES = {
+    "meteorite_categories": {
+        "table": "meteorites",
+        "joins": {"meteorite_classifications": "classification_id"},
+        "group_by": ["category"],
+        "measures": {"count": ("count", None)},
+        "order_by": [("count", True)],
+    },
+    "fall_vs_found": {
+        "table": "meteorites",
+        "joins": {"fall_types": "fall_type_id"},
+        "group_by": ["fall_type_name"],
+        "measures": {"count": ("count", None)},
+        "order_by": [("count", True)],
+    },
+    "discovery_timeline": {
+        "table": "meteorites",
+        "filters": [("gt", "year_discovered", 1800)],
+        "group_by": ["year_discovered"],
+        "measures": {"count": ("count", None)},
+        "order_by": [("year_discovered", False)],
+    },
+    "mass_statistics": {
+        "table": "meteorites",
+        "filters": [("gt", "mass_gram", 0)],
+        "group_by": [],
+        "measures": {
+            "total_mass": ("sum", "mass_gram"),
+            "avg_mass": ("avg", "mass_gram"),
+            "max_mass": ("max", "mass_gram"),
+            "min_mass": ("min", "mass_gram"),
+        },
+    },
+    "top_class_groups": {
+        "table": "meteorite_classifications",
+        "group_by": ["class_group"],
+        "measures": {"count": ("count", None)},
+        "order_by": [("count", True)],
+        "limit": 12,
+    },
+    "specimens_by_museum": {
+        "table": "meteorite_specimens",
+        "joins": {"museums": "museum_id"},
+        "group_by": ["museum_name"],
+        "measures": {"count": ("count", None)},
+        "order_by": [("count", True)],
+    },
+    "specimen_types": {
+        "table": "meteorite_specimens",
+        "group_by": ["specimen_type"],
+        "measures": {"count": ("count", None)},
+        "order_by": [("count", True)],
+    },
+    "specimen_conditions": {
+        "table": "meteorite_specimens",
+        "group_by": ["condition"],
+        "measures": {"count": ("count", None)},
+        "order_by": [("count", True)],
+    },
+    "specimen_mass": {
+        "table": "meteorite_specimens",
+        "group_by": [],
+        "measures": {"total_mass": ("sum", "specimen_mass_gram")},
+    },
+}
+
+_SQL_OPERATORS = {"eq": "=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+_PANDAS_OPERATORS = {
+    "eq": operator.eq, "gt": operator.gt, "gte": operator.ge,
+    "lt": operator.lt, "lte": operator.le,
+}
+_PANDAS_AGGREGATES = {"sum": "sum", "avg": "mean", "min": "min", "max": "max"}
+
+
+def view_name(chart_name):
+    return f"chart_{chart_name}"
+
+
+def chart_tables(chart_name):
+    """Tabel yang dibutuhkan untuk menghitung chart secara lokal"""
+    spec = CHART_QUERIES[chart_name]
+    return [spec["table"], *spec.get("joins", {})]
+
+
+def view_sql(chart_name):
+    """CREATE VIEW untuk satu named query"""
+    spec = CHART_QUERIES[chart_name]
+    measures = []
+    for name, (func, column) in spec["measures"].items():
+        expr = "count(*)" if func == "count" else f"{func}({column})"
+        measures.append(f"{expr} as {name}")
+    select = ", ".join(spec["group_by"] + measures)
+
+    lines = [
+        # security_invoker -> RLS tabel asal tetap berlaku untuk anon
+        f"create or replace view public.{view_name(chart_name)} with (security_invoker = on) as",
+        f"select {select}",
+        f"from public.{spec['table']}",
+    ]
+    for table, key in spec.get("joins", {}).items():
+        lines.append(f"left join public.{table} using ({key})")
+    conditions = [f"{column} is not null" for column in spec["group_by"]]
+    conditions += [
+        f"{column} {_SQL_OPERATORS[op]} {value!r}" for op, column, value in spec.get("filters", [])
+    ]
+    if conditions:
+        lines.append("where " + "\n  and ".join(conditions))
+    if spec["group_by"]:
+        lines.append("group by " + ", ".join(spec["group_by"]))
+    if spec.get("order_by"):
+        lines.append("order by " + ", ".join(
+            f"{column}{' desc' if desc else ''}" for column, desc in spec["order_by"]
+        ))
+    if spec.get("limit"):
+        lines.append(f"limit {spec['limit']}")
+    return "\n".join(lines) + ";"
+
+
+def aggregate_local(chart_name, frames):
+    """Hitung named query dari DataFrame lokal ({table_name: DataFrame})"""
+    spec = CHART_QUERIES[chart_name]
+    df = frames[spec["table"]]
+    for table, key in spec.get("joins", {}).items():
+        df = df.merge(frames[table], on=key, how="left")
+    for op, column, value in spec.get("filters", []):
+        df = df[_PANDAS_OPERATORS[op](df[column], value).fillna(False).astype(bool)]
+    if spec["group_by"]:
+        df = df.dropna(subset=spec["group_by"])
+    # Kolom float32 dijumlahkan dalam float64 supaya total tidak kehilangan presisi
+    measured = {column for func, column in spec["measures"].values() if func != "count"}
+    df = df.astype({column: "float64" for column in measured})
+
+    results = {}
+    for name, (func, column) in spec["measures"].items():
+        if spec["group_by"]:
+            grouped = df.groupby(spec["group_by"], observed=True)
+            results[name] = grouped.size() if func == "count" else grouped[column].agg(_PANDAS_AGGREGATES[func])
+        else:
+            results[name] = [len(df) if func == "count" else df[column].agg(_PANDAS_AGGREGATES[func])]
+
+    result = pd.DataFrame(results)
+    if spec["group_by"]:
+        result = result.reset_index()
+    if spec.get("order_by"):
+        result = result.sort_values(
+            [column for column, _ in spec["order_by"]],
+            ascending=[not desc for _, desc in spec["order_by"]],
+            kind="stable",
+        )
+    if spec.get("limit"):
+        result = result.head(spec["limit"])
+    return result.reset_index(drop=True)
+
+
+def fetch_aggregate(client, chart_name):
+    """Ambil hasil agregasi dari view chart_* (hanya baris hasil group-by)"""
+    response = client.table(view_name(chart_name)).select("*").execute()
+    columns = CHART_QUERIES[chart_name]["group_by"] + list(CHART_QUERIES[chart_name]["measures"])
+    return pd.DataFrame.from_records(response.data, columns=columns)
+
+
+if __name__ == "__main__":
+    print("-- ============================================================================")
+    print("-- Chart views (generated: python -m meteor.aggregates > sql/chart_views.sql)")
+    print("-- Dibaca oleh meteor.data.fetch_chart; kalau view belum ada -> pandas lokal")
+    print("-- ============================================================================")
+    for name in CHART_QUERIES:
+        print()
+        print(view_sql(name))
+        print(f"grant select on public.{view_name(name)} to anon, authenticated;")
@@ -0,0 +1,249 @@
+"""
+Benchmark dashboard terhadap Supabase palsu (meteor.fake), tanpa jaringan
+
+    python -m meteor.bench --rows 10000 100000 1000000 --latency 0.02 \\
+        --json bench.json --baseline bench_baseline.json
+
+Untuk setiap ukuran data: waktu per stage (load tabel, fact table, index,
+query filter, pencarian nama, binning, LOD globe, heatmap, figure cache,
+kartu, count, chart) plus jumlah request dan byte yang dikirim backend, lalu
+setiap halaman end-to-end lewat streamlit AppTest (cold = semua cache
+kosong, warm = rerun). Setiap stage diukur --runs kali dari cache kosong,
+yang dilaporkan median.
+
+Dengan --baseline (JSON hasil --json sebelumnya), stage yang lebih lambat dari
+baseline * (1 + tolerance) dilaporkan sebagai regresi dan exit code = 1.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import plotly.graph_objects as go
+
+# Snapshot & backend palsu harus di-set sebelum modul meteor di-import
+_SNAPSHOT_DIR = tempfile.mkdtemp(prefix="meteor-bench-")
+os.environ["METEOR_SNAPSHOT_DIR"] = _SNAPSHOT_DIR
+os.environ.setdefault("METEOR_FAKE_ROWS", "10000")
+
+from meteor import cards, data  # noqa: E402
+from meteor.binning import DECADE_BINS, LATITUDE_BINS, MASS_BINS  # noqa: E402
+from meteor.db import init_supabase  # noqa: E402
+from meteor.figures import cached_figure, figure_cache, show_figure  # noqa: E402
+from meteor.snapshot import data_version  # noqa: E402
+from meteor.spatial import SpatialIndex  # noqa: E402
+from meteor.store import table_store  # noqa: E402
+from meteor.views import PAGES, load_page  # noqa: E402
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# Halaman yang diukur end-to-end (label navigasi di app.py)
+BENCH_PAGES = ["🏠 Home", "☄️ Meteorites", "🌍 Globe Map", "📚 Research"]
+
+# Selisih di bawah ini dianggap noise, bukan regresi
+NOISE_FLOOR = 0.005
+
+
+def reset_caches():
+    """Kosongkan semua cache data (kecuali client/backend palsu) + snapshot di disk"""
+    table_store.clear()
+    figure_cache.clear()
+    cards._card_markup.clear()
+    data._missing_views.clear()
+    for cached in (
+        data._meteorite_facts, data._filter_index, data._aggregate_cube, data._spatial_index, data._name_index
+    ):
+        cached.clear()
+    shutil.rmtree(_SNAPSHOT_DIR, ignore_errors=True)
+
+
+class StageTimer:
+    """Kumpulkan {stage: [(detik, request, byte), ...]} untuk satu ukuran data"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.samples = {}
+
+    def measure(self, stage, func, *args, **kwargs):
+        requests, sent = self.backend.requests, self.backend.bytes_sent
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        self.samples.setdefault(stage, []).append(
+            (elapsed, self.backend.requests - requests, self.backend.bytes_sent - sent)
+        )
+        return result
+
+    def summary(self):
+        return {
+            stage: {
+                "seconds": statistics.median(s[0] for s in samples),
+                "requests": int(statistics.median(s[1] for s in samples)),
+                "bytes": int(statistics.median(s[2] for s in samples)),
+            }
+            for stage, samples in self.samples.items()
+        }
+
+
+def run_stages(timer):
+    """Satu pass semua stage dari cache kosong"""
+    reset_caches()
+    tables = {}
+    for view in map(load_page, PAGES):
+        for name in view.TABLES:
+            if name not in tables:
+                tables[name] = timer.measure(f"load:{name}", data.fetch_data, name)
+
+    # Snapshot Arrow di disk (store kosong, snapshot masih segar)
+    table_store.clear()
+    timer.measure("load:snapshot:meteorites", data.fetch_data, "meteorites")
+
+    facts = timer.measure("facts", data.meteorite_facts, tables)
+    index = timer.measure("filter:index", data.filter_index, facts)
+    result = timer.measure(
+        "filter:query", index.query, (1900, 2023), category="All", fall_type_name="Fell"
+    )
+    timer.measure("filter:frame", result.frame, ["meteorite_id", "name", "mass_gram", "year_discovered"])
+    timer.measure("filter:page", result.page, "name", 1000, 1100, False, ["meteorite_id", "name", "mass_gram"])
+    timer.measure("filter:top15", result.top, "mass_gram", 15, ["name", "mass_gram", "year_discovered"])
+    timer.measure("bins:mass", result.bin_counts, "mass_gram", MASS_BINS)
+    timer.measure("bins:decade", result.bin_counts, "year_discovered", DECADE_BINS)
+    timer.measure("bins:latitude", index.query().bin_counts, "latitude", LATITUDE_BINS)
+
+    cube = timer.measure("cube:build", data.aggregate_cube, facts)
+    summary = timer.measure("cube:query", cube.query, (1900, 2023), category="All", fall_type_name="Fell")
+    timer.measure("cube:groups", summary.value_counts, "class_group")
+    timer.measure("cube:mass", summary.mass_counts)
+
+    names = timer.measure("search:index", data.name_index, facts)
+    timer.measure("search:prefix", names.search, "allan", 20)
+    timer.measure("search:fuzzy", names.search, "alan hils", 20)
+
+    spatial = timer.measure("spatial:index", data.spatial_index, facts)
+    timer.measure("spatial:view", spatial.view, 5000)
+    timer.measure("spatial:density", spatial.density_grid, 2.0, "count", 1.0)
+    # Label hover diukur di index baru (view di atas sudah meng-cache hover_frame)
+    timer.measure("spatial:hover", SpatialIndex(facts).hover_frame)
+
+    # Figure cache: build pertama (miss) vs rerun dengan input sama (hit),
+    # keduanya sampai serialisasi st.plotly_chart (show_figure)
+    _, singles, _ = spatial.view(5000)
+
+    def build():
+        return go.Figure(go.Scattergeo(lon=singles["longitude"], lat=singles["latitude"], mode="markers"))
+
+    for stage in ("figure:miss", "figure:hit"):
+        timer.measure(stage, lambda: show_figure(cached_figure("bench_globe", (data_version(facts),), build)))
+
+    # HTML kartu direktori museum & tim peneliti (semua baris, sekali per version)
+    for name, build in (("museums", load_page("🏛️ Museums").museum_cards),
+                        ("researchers", load_page("📚 Research").researcher_cards)):
+        frame = tables[name]
+        timer.measure(f"cards:{name}", cards._card_markup, name, data_version(frame), frame, build)
+
+    counts = sorted({name for view in map(load_page, PAGES) for name in ["meteorites"] + view.COUNTS})
+    timer.measure("counts", data.get_table_counts, tuple(counts))
+    for view in map(load_page, PAGES):
+        for name in view.CHARTS:
+            timer.measure(f"chart:{name}", data.fetch_chart, name)
+
+
+def run_pages(timer):
+    """Setiap halaman lewat AppTest: cold (cache kosong) lalu warm (rerun)"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=600)
+    at.run()
+    for label in BENCH_PAGES:
+        name = load_page(label).__name__.rsplit(".", 1)[-1]
+        reset_caches()
+        timer.measure(f"page:{name}:cold", at.sidebar.radio[0].set_value(label).run)
+        timer.measure(f"page:{name}:warm", at.run)
+        if name == "meteorites":
+            # Ganti filter -> hanya fragment filter yang jalan ulang
+            timer.measure(f"page:{name}:filter", at.selectbox[1].set_value("Fell").run)
+        if at.exception:
+            raise RuntimeError(f"Halaman {label} error: {at.exception[0].value}")
+
+
+def run_size(rows, latency, runs, pages=True):
+    os.environ["METEOR_FAKE_ROWS"] = str(rows)
+    os.environ["METEOR_FAKE_LATENCY"] = str(latency)
+    init_supabase.clear()
+    start = time.perf_counter()
+    backend = init_supabase().fake_backend
+    print(f"\n== {rows:,} baris (generate {time.perf_counter() - start:.1f}s, latency {latency}s)")
+
+    timer = StageTimer(backend)
+    for _ in range(runs):
+        run_stages(timer)
+        if pages:
+            run_pages(timer)
+    return timer.summary()
+
+
+def print_table(rows, summary, baseline=None):
+    print(f"{'stage':<40}{'seconds':>10}{'baseline':>10}{'requests':>10}{'bytes':>14}")
+    for stage, result in summary.items():
+        base = (baseline or {}).get(stage, {}).get("seconds")
+        base_text = f"{base:.4f}" if base is not None else "-"
+        print(f"{stage:<40}{result['seconds']:>10.4f}{base_text:>10}"
+              f"{result['requests']:>10,}{result['bytes']:>14,}")
+
+
+def regressions(results, baseline, tolerance):
+    """[(rows, stage, detik, detik baseline)] yang melewati toleransi"""
+    found = []
+    for rows, summary in results.items():
+        for stage, result in summary.items():
+            base = baseline.get(rows, {}).get(stage)
+            if base is None:
+                continue
+            limit = base["seconds"] * (1 + tolerance)
+            if result["seconds"] > limit and result["seconds"] - base["seconds"] > NOISE_FLOOR:
+                found.append((rows, stage, result["seconds"], base["seconds"]))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--latency", type=float, default=0.0, help="latency per request (detik)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--no-pages", action="store_true", help="lewati pengukuran AppTest per halaman")
+    parser.add_argument("--json", help="simpan hasil ke file JSON")
+    parser.add_argument("--baseline", help="JSON hasil sebelumnya untuk deteksi regresi")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    try:
+        for rows in args.rows:
+            summary = run_size(rows, args.latency, args.runs, pages=not args.no_pages)
+            results[str(rows)] = summary
+            print_table(rows, summary, baseline.get(str(rows)))
+    finally:
+        shutil.rmtree(_SNAPSHOT_DIR, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"latency": args.latency, "runs": args.runs, "results": results}, f, indent=2)
+
+    found = regressions(results, baseline, args.tolerance)
+    for rows, stage, seconds, base in found:
+        print(f"REGRESI {rows} {stage}: {seconds:.4f}s (baseline {base:.4f}s)")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
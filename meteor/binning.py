@@ -0,0 +1,78 @@
+"""
+Binning vektor: np.digitize untuk assignment + np.bincount untuk hitungan per bin
+
+Assignment (kode bin per baris) di-cache per data version lewat FilterIndex.bin_codes,
+jadi ganti filter hanya menghitung ulang bincount atas baris terpilih.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class Bins:
+    """
+    Definisi bin dengan batas `edges` (n+1 angka untuk n bin, kiri inklusif;
+    batas paling atas ikut bin terakhir, seperti np.histogram).
+    Nilai di luar rentang atau NaN -> kode -1 (tidak dihitung).
+    lower_open=True berarti batas paling bawah eksklusif (mis. massa > 0).
+    """
+
+    def __init__(self, name, edges, labels=None, lower_open=False):
+        self.name = name
+        self.edges = np.asarray(edges, dtype="float64")
+        self.labels = list(labels) if labels is not None else [
+            f"{low:g} - {high:g}" for low, high in zip(self.edges[:-1], self.edges[1:])
+        ]
+        self.lower_open = lower_open
+        if len(self.labels) != len(self.edges) - 1:
+            raise ValueError(f"Bins {name}: {len(self.labels)} label untuk {len(self.edges) - 1} bin")
+
+    def __len__(self):
+        return len(self.labels)
+
+    def codes(self, values):
+        """Kode bin (int16) untuk setiap nilai, -1 kalau di luar rentang"""
+        values = np.asarray(values, dtype="float64")
+        codes = np.digitize(values, self.edges) - 1
+        codes[values == self.edges[-1]] = len(self) - 1
+        outside = np.isnan(values) | (codes < 0) | (codes >= len(self))
+        if self.lower_open:
+            outside |= values == self.edges[0]
+        codes[outside] = -1
+        return codes.astype(np.int16)
+
+    def counts(self, codes):
+        """Jumlah per bin dari array kode (kode -1 diabaikan)"""
+        return np.bincount(codes[codes >= 0], minlength=len(self))
+
+    def series(self, counts):
+        """Hitungan sebagai Series berindeks kategori berurutan (bin kosong tetap ada)"""
+        index = pd.CategoricalIndex(self.labels, categories=self.labels, ordered=True, name=self.name)
+        return pd.Series(counts, index=index, name="count")
+
+
+def uniform_bins(name, start, stop, width):
+    """Bin selebar `width` dari start sampai stop, label = batas bawah"""
+    edges = np.arange(start, stop + width, width)
+    return Bins(name, edges, labels=[f"{low:g}" for low in edges[:-1]])
+
+
+# Kategori massa halaman Meteorites (hanya massa > 0)
+MASS_BINS = Bins(
+    "mass",
+    [0, 100, 1_000, 10_000, 100_000, np.inf],
+    labels=[
+        "Sangat Ringan\n(< 100g)",
+        "Ringan\n(100g - 1kg)",
+        "Sedang\n(1kg - 10kg)",
+        "Berat\n(10kg - 100kg)",
+        "Sangat Berat\n(> 100kg)",
+    ],
+    lower_open=True,
+)
+
+# Histogram tahun per dekade (rentang slider halaman Meteorites)
+DECADE_BINS = uniform_bins("decade", 800, 2030, 10)
+
+# 36 bin latitude selebar 5 derajat (sama dengan nbins=36 sebelumnya)
+LATITUDE_BINS = uniform_bins("latitude", -90, 90, 5)
@@ -0,0 +1,71 @@
+"""
+Daftar kartu (direktori museum, tim peneliti) sebagai satu blok HTML per halaman
+
+Satu elemen Streamlit per baris (expander / markdown di loop iterrows) membuat
+jumlah delta & byte websocket tumbuh linear dengan jumlah baris. Di sini:
+- HTML semua kartu dibangun sekaligus dengan operasi string pandas (tanpa
+  iterrows), sekali per data version
+- yang dikirim ke browser hanya kartu satu halaman, sebagai SATU st.markdown
+- ganti halaman hanya menjalankan ulang fragment daftar kartu
+Style kartu (class meteor-card) ada di CSS global app.py.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from meteor.perf import perf
+from meteor.snapshot import data_version
+
+# Pilihan jumlah kartu per halaman (kelipatan 3 kolom grid)
+CARD_PAGE_SIZES = [12, 24, 48, 96]
+
+_HTML_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;"))
+
+
+def card_text(frame, name, default="N/A"):
+    """Kolom sebagai teks HTML-escaped (kolom tidak ada / NULL -> default), vectorized"""
+    if name not in frame.columns:
+        return pd.Series(default, index=frame.index, dtype="string")
+    text = frame[name].astype("string").fillna(default)
+    for char, entity in _HTML_ESCAPES:
+        text = text.str.replace(char, entity, regex=False)
+    return text
+
+
+@st.cache_resource(max_entries=4)
+def _card_markup(card_id, version, _frame, _build):
+    with perf.timer(f"cards:{card_id}"):
+        # Satu baris HTML per kartu; tanpa newline supaya markdown tidak
+        # menganggapnya paragraf / code block
+        return np.asarray(_build(_frame).str.replace("\n", " ", regex=False), dtype=object)
+
+
+@st.fragment
+def card_list(card_id, frame, build, columns=3):
+    """
+    Grid kartu per halaman. build(frame) -> Series HTML satu kartu per baris
+    (pakai card_text untuk kolom), di-cache per (card_id, data version).
+    """
+    cards = _card_markup(card_id, data_version(frame), frame, build)
+    total = len(cards)
+    start, stop = 0, total
+    if total > CARD_PAGE_SIZES[0]:
+        col_info, col_size, col_page = st.columns([2, 1, 1])
+        with col_size:
+            page_size = st.selectbox("Cards per page", CARD_PAGE_SIZES, index=1, key=f"{card_id}_page_size")
+        pages = max(1, -(-total // page_size))
+        with col_page:
+            page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1, step=1,
+                                   key=f"{card_id}_page_{pages}")
+        start = (page - 1) * page_size
+        stop = min(start + page_size, total)
+        with col_info:
+            st.caption(f"{start + 1:,}–{stop:,} of {total:,}")
+
+    with perf.timer("render:cards"):
+        st.markdown(
+            f"<div class='meteor-card-grid' style='grid-template-columns: repeat({columns}, minmax(0, 1fr));'>"
+            + "".join(cards[start:stop]) + "</div>",
+            unsafe_allow_html=True
+        )
@@ -0,0 +1,124 @@
+"""
+Aggregate cube: jumlah & statistik massa per kombinasi dimensi, sekali per data version
+
+Dimensi: tahun, category, class_group, fall_type_name dan bin massa
+(MASS_BINS). Setiap baris fact table jatuh ke satu sel; yang disimpan hanya
+sel yang berisi (sparse), dengan count, mass_count (massa > 0), mass_sum dan
+mass_max. Filter + chart halaman Meteorites cukup memilih sel lalu bincount,
+jadi biayanya sebanding jumlah sel, bukan jumlah baris.
+"""
+
+import numpy as np
+import pandas as pd
+
+from meteor.binning import MASS_BINS
+
+# Dimensi kategori (kode dari FilterIndex.codes, -1 = NULL)
+CUBE_DIMENSIONS = ("category", "class_group", "fall_type_name")
+
+
+class CubeSlice:
+    """Sel cube yang lolos filter; API mirip FilterResult untuk agregat"""
+
+    def __init__(self, cube, mask):
+        self.cube = cube
+        self.mask = mask
+
+    def __len__(self):
+        return int(self.cube.count[self.mask].sum())
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def value_counts(self, name):
+        """Jumlah baris per nilai dimensi kategori (urut menurun, tanpa 0)"""
+        codes = self.cube.cells[name][self.mask]
+        counts = self.cube.count[self.mask]
+        categories = self.cube.categories[name]
+        known = codes >= 0
+        totals = np.bincount(codes[known], weights=counts[known], minlength=len(categories))
+        result = pd.Series(totals.astype(np.int64), index=categories, name="count")
+        return result[result > 0].sort_values(ascending=False, kind="stable")
+
+    def mass_counts(self):
+        """Jumlah per bin MASS_BINS (bin kosong tetap ada)"""
+        codes = self.cube.cells["mass"][self.mask]
+        counts = self.cube.count[self.mask]
+        known = codes >= 0
+        totals = np.bincount(codes[known], weights=counts[known], minlength=len(MASS_BINS))
+        return MASS_BINS.series(totals.astype(np.int64))
+
+    def mass_stats(self):
+        """(jumlah massa > 0, total, rata-rata, maksimum) dalam gram"""
+        n = int(self.cube.mass_count[self.mask].sum())
+        if n == 0:
+            return 0, 0.0, np.nan, np.nan
+        total = float(self.cube.mass_sum[self.mask].sum())
+        return n, total, total / n, float(np.nanmax(self.cube.mass_max[self.mask]))
+
+
+class AggregateCube:
+    def __init__(self, index):
+        """Dibangun dari FilterIndex (kode kategori & bin massa dipakai ulang)"""
+        facts = index.facts
+        size = len(facts)
+        self.categories = {}
+        dims = {}
+        for name in CUBE_DIMENSIONS:
+            if name in facts.columns:
+                dims[name], self.categories[name] = index.codes(name)
+            else:
+                dims[name], self.categories[name] = np.full(size, -1), pd.Index([])
+        mass = index.values("mass_gram") if "mass_gram" in facts.columns else np.full(size, np.nan)
+        dims["mass"] = index.bin_codes("mass_gram", MASS_BINS) if "mass_gram" in facts.columns else np.full(size, -1)
+
+        # Tahun -> offset dari tahun terkecil, NULL -> -1
+        years = index.values("year_discovered") if "year_discovered" in facts.columns else np.full(size, np.nan)
+        dated = ~np.isnan(years)
+        self.year_min = int(years[dated].min()) if dated.any() else 0
+        dims["year"] = np.where(dated, np.nan_to_num(years) - self.year_min, -1).astype(np.int64)
+
+        # Kunci sel = mixed radix atas kode + 1 (supaya -1 ikut jadi digit)
+        key = np.zeros(size, dtype=np.int64)
+        radix = {}
+        for name, codes in dims.items():
+            radix[name] = int(codes.max(initial=-1)) + 2
+            key = key * radix[name] + (codes.astype(np.int64) + 1)
+        cells, inverse = np.unique(key, return_inverse=True)
+
+        # Decode kunci sel kembali ke kode per dimensi
+        self.cells = {}
+        remainder = cells
+        for name in reversed(list(dims)):
+            self.cells[name] = (remainder % radix[name] - 1).astype(np.int32)
+            remainder = remainder // radix[name]
+
+        weighed = mass > 0
+        self.count = np.bincount(inverse, minlength=len(cells))
+        self.mass_count = np.bincount(inverse, weights=weighed, minlength=len(cells))
+        self.mass_sum = np.bincount(inverse, weights=np.where(weighed, mass, 0.0), minlength=len(cells))
+        self.mass_max = np.full(len(cells), np.nan)
+        np.fmax.at(self.mass_max, inverse[weighed], mass[weighed])
+
+    def __len__(self):
+        return len(self.count)
+
+    def query(self, year_range=None, **equals):
+        """
+        Sama seperti FilterIndex.query tapi atas sel: query((1900, 2023), category="Iron").
+        Nilai None / "All" berarti dimensi itu tidak difilter.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if year_range is not None:
+            low, high = year_range
+            years = self.cells["year"]
+            mask &= (years >= 0) & (years >= low - self.year_min) & (years <= high - self.year_min)
+        for name, value in equals.items():
+            if value is None or value == "All":
+                continue
+            categories = self.categories.get(name)
+            if categories is None or value not in categories:
+                return CubeSlice(self, np.zeros(len(self), dtype=bool))
+            mask &= self.cells[name] == categories.get_loc(value)
+        return CubeSlice(self, mask)
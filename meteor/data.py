@@ -0,0 +1,263 @@
+"""
+Cached data API yang dipakai halaman dashboard
+
+Tabel, count dan hasil chart semuanya disimpan di table store bersama
+(meteor.store) dan di-refresh di background oleh meteor.scheduler sebelum
+TTL-nya habis, jadi request user tidak pernah menunggu reload dari Supabase
+(kecuali load pertama kali sejak proses jalan).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+from postgrest.exceptions import APIError
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from meteor.aggregates import aggregate_local, chart_tables, fetch_aggregate
+from meteor.cube import AggregateCube
+from meteor.db import batch_counts, head_count, init_supabase, load_table_pages, pages_to_frame
+from meteor.facts import FACT_TABLES, build_meteorite_facts
+from meteor.filters import FilterIndex
+from meteor.perf import perf, timed
+from meteor.schema import apply_schema, table_columns
+from meteor.search import NameIndex
+from meteor.snapshot import data_version, load_with_snapshot, refresh_snapshot
+from meteor.spatial import SpatialIndex
+from meteor.store import STORE_TTL, table_store
+from meteor.sync import delta_sync, full_load
+
+# Jumlah query halaman yang jalan bersamaan (semua lewat satu client Supabase,
+# jadi koneksi keep-alive di pool httpx dipakai ulang)
+PREFETCH_WORKERS = 6
+
+# View chart_* yang belum dipasang di database (cek sekali per proses)
+_missing_views = set()
+# Kode error PostgREST/Postgres untuk relation (view) yang tidak ada
+_MISSING_RELATION_CODES = ("42P01", "PGRST205")
+
+# TTL per tabel (detik): tabel referensi jarang berubah -> refresh lebih jarang.
+# Tabel lain, count dan chart memakai STORE_TTL.
+TABLE_TTLS = {
+    "fall_types": 3600,
+    "meteorite_classifications": 3600,
+    "museums": 1800,
+}
+
+
+def _load_table(client, table_name, limit, columns, revalidate=False):
+    """
+    Load pertama: snapshot di disk kalau ada (lihat load_with_snapshot).
+    revalidate=True (dari scheduler): sinkronkan snapshot dengan server dulu.
+    """
+    stage = "refresh" if revalidate else "load"
+    with perf.timer(f"{stage}:{table_name}"):
+        if limit is not None:
+            pages = load_table_pages(client, table_name, columns=columns, limit=limit)
+            return apply_schema(pages_to_frame(pages, columns), table_name)
+
+        def loader():
+            return full_load(client, table_name, columns)
+
+        if not revalidate:
+            return load_with_snapshot(table_name, columns, loader)
+        return refresh_snapshot(
+            table_name, columns, loader,
+            lambda df, state: delta_sync(client, table_name, columns, df, state),
+        )
+
+
+def fetch_data(table_name, limit=None, columns=None):
+    """
+    Ambil tabel lengkap dengan dtype ringkas dari schema registry.
+    columns=None -> kolom terdaftar di TABLE_SCHEMAS (atau "*" untuk tabel lain).
+    Tabel penuh (tanpa limit) dilayani dari snapshot Arrow di disk kalau ada,
+    lalu di-update incremental (delta sync) di background oleh scheduler.
+    Frame disimpan sekali di table store bersama (meteor.store) dan setiap
+    pemanggil mendapat view zero-copy, bukan salinan sendiri.
+    """
+    try:
+        return _fetch_table(table_name, limit, columns)
+    except Exception as e:
+        # Gagal load tidak disimpan di store -> rerun berikutnya mencoba lagi
+        st.error(f"Error: {e}")
+        return pd.DataFrame()
+
+
+def _fetch_table(table_name, limit=None, columns=None, client=None):
+    """Seperti fetch_data tapi error diteruskan (untuk pemanggil yang di-cache)"""
+    # Client diambil di thread script lalu dibawa closure loader/refresh: refresh
+    # jalan di thread scheduler, tanpa ScriptRunContext untuk st.cache_resource
+    client = client or init_supabase()
+    columns = list(columns) if columns else table_columns(table_name)
+    key = (table_name, limit, tuple(columns) if columns else None)
+    with perf.timer(f"fetch:{table_name}"):
+        return table_store.get_or_load(
+            key,
+            lambda: _load_table(client, table_name, limit, columns),
+            ttl=TABLE_TTLS.get(table_name, STORE_TTL),
+            refresh=lambda: _load_table(client, table_name, limit, columns, revalidate=True),
+        )
+
+
+# Count & chart juga lewat table_store (count sebagai Series). Loader yang
+# raise tidak disimpan, jadi error sementara tidak di-cache sebagai 0 / frame
+# kosong; wrapper publik yang menampilkan st.error.
+
+def _counts(key, counter):
+    """{table_name: count} dari store; counter() -> dict dipanggil saat miss / refresh"""
+    def load():
+        with perf.timer("fetch:counts"):
+            return pd.Series(counter(), dtype="int64")
+    return {name: int(value) for name, value in table_store.get_or_load(key, load).items()}
+
+
+def get_table_count(table_name, count="exact"):
+    """Get total count of records in a table"""
+    try:
+        client = init_supabase()
+        counts = _counts(
+            ("count", table_name, count),
+            lambda: {table_name: head_count(client, table_name, count)},
+        )
+        return counts[table_name]
+    except Exception as e:
+        st.error(f"Error counting {table_name}: {e}")
+        return 0
+
+
+def get_table_counts(table_names, count="exact"):
+    """Get counts for several tables in one go -> {table_name: count}"""
+    try:
+        table_names = tuple(table_names)
+        client = init_supabase()
+        return _counts(
+            ("counts", table_names, count),
+            lambda: batch_counts(client, table_names, count),
+        )
+    except Exception as e:
+        st.error(f"Error counting {', '.join(table_names)}: {e}")
+        return {name: 0 for name in table_names}
+
+
+def fetch_chart(chart_name):
+    """
+    Hasil named query chart (meteor.aggregates). Dihitung di Postgres lewat view
+    chart_*, jadi yang lewat jaringan hanya baris hasil agregasi. Kalau view
+    belum ada, dihitung lokal dari tabel mentah.
+    """
+    try:
+        client = init_supabase()
+        return table_store.get_or_load(("chart", chart_name), lambda: _fetch_chart(client, chart_name))
+    except Exception as e:
+        st.error(f"Error loading chart {chart_name}: {e}")
+        return pd.DataFrame()
+
+
+def _fetch_chart(client, chart_name):
+    with perf.timer(f"fetch:chart:{chart_name}"):
+        result = None
+        if chart_name not in _missing_views:
+            try:
+                result = fetch_aggregate(client, chart_name)
+            except APIError as e:
+                # Hanya "view belum ada" yang diingat; error lain cukup fallback kali ini
+                if e.code in _MISSING_RELATION_CODES:
+                    _missing_views.add(chart_name)
+        if result is None:
+            frames = {name: _fetch_table(name, client=client) for name in chart_tables(chart_name)}
+            if any(frame.empty for frame in frames.values()):
+                return pd.DataFrame()
+            result = aggregate_local(chart_name, frames)
+        # Hasil agregasi kecil -> version = hash isi (kunci figure cache)
+        digest = int(pd.util.hash_pandas_object(result, index=False).sum())
+        result.attrs["version"] = f"chart-{digest:x}"
+        return result
+
+
+@st.cache_resource(max_entries=2)
+@timed("transform:facts")
+def _meteorite_facts(versions, _meteorites, _classifications, _fall_types, _locations):
+    facts = build_meteorite_facts(_meteorites, _classifications, _fall_types, _locations)
+    facts.attrs["version"] = "+".join(versions)
+    return facts
+
+
+def meteorite_facts(data):
+    """
+    Fact table meteorites bersama (lihat meteor.facts), dibangun sekali per
+    data version dan dipakai bersama oleh semua session. READ-ONLY: jangan
+    diubah in-place, filter/copy dulu.
+    """
+    frames = [data[name] for name in FACT_TABLES]
+    versions = tuple(data_version(frame) for frame in frames)
+    return _meteorite_facts(versions, *frames)
+
+
+@st.cache_resource(max_entries=2)
+@timed("transform:filter_index")
+def _filter_index(version, _facts):
+    return FilterIndex(_facts)
+
+
+def filter_index(facts):
+    """FilterIndex untuk fact table (dibangun sekali per data version)"""
+    return _filter_index(data_version(facts), facts)
+
+
+@st.cache_resource(max_entries=2)
+@timed("transform:cube")
+def _aggregate_cube(version, _facts):
+    return AggregateCube(filter_index(_facts))
+
+
+def aggregate_cube(facts):
+    """AggregateCube (count & massa per sel dimensi) untuk fact table, sekali per data version"""
+    return _aggregate_cube(data_version(facts), facts)
+
+
+@st.cache_resource(max_entries=2)
+@timed("transform:spatial_index")
+def _spatial_index(version, _facts):
+    return SpatialIndex(_facts)
+
+
+def spatial_index(facts):
+    """SpatialIndex (grid LOD globe) untuk fact table, sekali per data version"""
+    return _spatial_index(data_version(facts), facts)
+
+
+@st.cache_resource(max_entries=2)
+@timed("transform:name_index")
+def _name_index(version, _facts):
+    names = _facts["name"] if "name" in _facts.columns else [""] * len(_facts)
+    return NameIndex(names)
+
+
+def name_index(facts):
+    """NameIndex (prefix + trigram) atas nama meteorit, sekali per data version"""
+    return _name_index(data_version(facts), facts)
+
+
+def prefetch(tables=(), counts=(), charts=()):
+    """
+    Ambil semua tabel, count dan chart yang dibutuhkan satu halaman secara paralel.
+    Return (data, counts, charts): {table_name: DataFrame}, {table_name: count},
+    {chart_name: DataFrame}. Latency = query paling lambat, bukan jumlah semua query.
+    """
+    ctx = get_script_run_ctx()
+
+    def attach_ctx():
+        # Supaya st.error dari fetch_data di worker thread tetap tampil di halaman
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+
+    tables = list(dict.fromkeys(tables))
+    with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, initializer=attach_ctx) as pool:
+        count_future = pool.submit(get_table_counts, tuple(dict.fromkeys(counts))) if counts else None
+        futures = {name: pool.submit(fetch_data, name) for name in tables}
+        chart_futures = {name: pool.submit(fetch_chart, name) for name in dict.fromkeys(charts)}
+        data = {name: future.result() for name, future in futures.items()}
+        chart_data = {name: future.result() for name, future in chart_futures.items()}
+        return data, (count_future.result() if count_future else {}), chart_data
@@ -0,0 +1,86 @@
+"""
+Meteorite fact table: meteorites + lookup (klasifikasi, fall type, lokasi) dalam satu frame
+
+Dibangun sekali per data version. Lookup dilakukan dengan array posisi
+(id -> nomor baris lookup) dan kolom kategori diambil lewat kode kategorinya,
+jadi tidak ada hash merge / salinan 45k baris di setiap rerun.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Tabel yang dibutuhkan untuk membangun fact table
+FACT_TABLES = ("meteorites", "meteorite_classifications", "fall_types", "locations")
+
+# Kalau id lookup sangat jarang (max id >> jumlah baris), pakai Index.get_indexer
+_DENSE_FACTOR = 8
+
+
+def lookup_positions(lookup_ids, keys):
+    """
+    Posisi baris di tabel lookup untuk setiap key (-1 = key NULL / tidak ditemukan).
+    Setara LEFT JOIN tanpa membangun hasil merge.
+    """
+    ids = lookup_ids.to_numpy(dtype="float64", na_value=np.nan)
+    keys = keys.to_numpy(dtype="float64", na_value=np.nan)
+    valid_ids = ~np.isnan(ids)
+    valid_keys = ~np.isnan(keys)
+    positions = np.full(len(keys), -1, dtype=np.int64)
+    if not valid_ids.any() or not valid_keys.any():
+        return positions
+
+    ids_int = ids[valid_ids].astype(np.int64)
+    keys_int = keys[valid_keys].astype(np.int64)
+    max_id = int(ids_int.max())
+    if ids_int.min() >= 0 and max_id <= _DENSE_FACTOR * max(len(ids_int), 1024):
+        # Direct-address table: id -> posisi baris
+        table = np.full(max_id + 1, -1, dtype=np.int64)
+        table[ids_int] = np.flatnonzero(valid_ids)
+        in_range = (keys_int >= 0) & (keys_int <= max_id)
+        found = np.full(len(keys_int), -1, dtype=np.int64)
+        found[in_range] = table[keys_int[in_range]]
+    else:
+        index = pd.Index(ids_int)
+        found = index.get_indexer(keys_int)
+        found = np.where(found >= 0, np.flatnonzero(valid_ids)[found], -1)
+    positions[valid_keys] = found
+    return positions
+
+
+def take_categorical(values, positions):
+    """Ambil kolom lookup sebagai Categorical (kode kategori, bukan string)"""
+    categorical = pd.Categorical(values)
+    codes = np.where(positions >= 0, categorical.codes[positions], -1)
+    return pd.Categorical.from_codes(codes, categories=categorical.categories)
+
+
+def take_numeric(values, positions, dtype="float32"):
+    """Ambil kolom numerik lookup, NaN untuk key yang tidak ditemukan"""
+    array = values.to_numpy(dtype=dtype, na_value=np.nan)
+    return np.where(positions >= 0, array[positions], np.nan).astype(dtype)
+
+
+def build_meteorite_facts(meteorites, classifications, fall_types, locations):
+    """
+    Frame gabungan read-only untuk semua halaman:
+    kolom meteorites + category, class_group, fall_type_name, latitude, longitude.
+    """
+    facts = meteorites.reset_index(drop=True).copy()
+    if facts.empty:
+        return facts
+
+    if not classifications.empty and "classification_id" in facts.columns:
+        positions = lookup_positions(classifications["classification_id"], facts["classification_id"])
+        facts["category"] = take_categorical(classifications["category"], positions)
+        facts["class_group"] = take_categorical(classifications["class_group"], positions)
+
+    if not fall_types.empty and "fall_type_id" in facts.columns:
+        positions = lookup_positions(fall_types["fall_type_id"], facts["fall_type_id"])
+        facts["fall_type_name"] = take_categorical(fall_types["fall_type_name"], positions)
+
+    if not locations.empty and "location_id" in facts.columns:
+        positions = lookup_positions(locations["location_id"], facts["location_id"])
+        facts["latitude"] = take_numeric(locations["latitude"], positions)
+        facts["longitude"] = take_numeric(locations["longitude"], positions)
+
+    return facts
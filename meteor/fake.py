@@ -0,0 +1,361 @@
+"""
+Supabase palsu (offline) untuk development & benchmark
+
+Client supabase-py asli dipasang ke httpx.MockTransport yang meniru PostgREST
+di atas DataFrame hasil generate, jadi seluruh jalur kode yang sama ikut teruji:
+select / order / eq / gt / gte / lt / lte / not.is / in / limit / offset,
+HEAD + Prefer: count, RPC table_counts, dan view chart_* (meteor.aggregates).
+
+Dipakai oleh init_supabase kalau METEOR_FAKE_ROWS di-set, contoh:
+    METEOR_FAKE_ROWS=100000 METEOR_FAKE_LATENCY=0.03 streamlit run app.py
+"""
+
+import json
+import random
+import threading
+import time
+
+import httpx
+import numpy as np
+import pandas as pd
+from supabase import create_client
+
+from meteor.aggregates import CHART_QUERIES, aggregate_local, view_name
+from meteor.transport import make_session
+
+FAKE_URL = "https://fake.supabase.local"
+# Bentuknya harus JWT supaya lolos validasi create_client (isinya tidak dicek)
+FAKE_KEY = "fake.fake.fake"
+
+# (category, class_group, bobot) kira-kira mengikuti proporsi NASA Meteoritical Bulletin
+CLASS_GROUPS = [
+    ("Chondrite", "L", 24), ("Chondrite", "H", 22), ("Chondrite", "LL", 9),
+    ("Chondrite", "CM", 1.2), ("Chondrite", "CO", 0.8), ("Chondrite", "CV", 0.7),
+    ("Chondrite", "CK", 0.5), ("Chondrite", "CR", 0.5), ("Chondrite", "EH", 0.4),
+    ("Chondrite", "EL", 0.3), ("Chondrite", "R", 0.3),
+    ("Achondrite", "Eucrite", 1.0), ("Achondrite", "Howardite", 0.5),
+    ("Achondrite", "Diogenite", 0.5), ("Achondrite", "Ureilite", 0.6),
+    ("Achondrite", "Aubrite", 0.1), ("Achondrite", "Lunar", 0.5), ("Achondrite", "Martian", 0.3),
+    ("Iron", "IAB", 0.5), ("Iron", "IIAB", 0.3), ("Iron", "IIIAB", 0.6),
+    ("Iron", "IVA", 0.2), ("Iron", "IVB", 0.05),
+    ("Stony-iron", "Pallasite", 0.2), ("Stony-iron", "Mesosiderite", 0.3),
+]
+# Petrologic type untuk kelompok chondrite biasa
+PETROLOGIC_TYPES = (3, 4, 5, 6)
+
+# (nama lokasi, lat min/max, lon min/max, bobot)
+FIND_REGIONS = [
+    ("Allan Hills", (-86.0, -70.0), (-180.0, 180.0), 55),
+    ("Northwest Africa", (20.0, 32.0), (-12.0, 10.0), 20),
+    ("Dhofar", (17.0, 21.0), (53.0, 58.0), 5),
+    ("Meteorite", (-60.0, 70.0), (-180.0, 180.0), 20),
+]
+
+TERRAIN_TYPES = ["Ice Field", "Desert", "Plain", "Forest", "Mountain", "Urban"]
+
+
+def generate_tables(rows=10_000, seed=0):
+    """Dataset mirip NASA Meteorite Landings dengan `rows` meteorit -> {tabel: DataFrame}"""
+    rng = np.random.default_rng(seed)
+
+    class_rows = []
+    for category, group, weight in CLASS_GROUPS:
+        types = PETROLOGIC_TYPES if group in ("H", "L", "LL") else (None,)
+        for _ in types:
+            class_rows.append((category, group, weight / len(types)))
+    classifications = pd.DataFrame({
+        "classification_id": np.arange(1, len(class_rows) + 1),
+        "category": [c for c, _, _ in class_rows],
+        "class_group": [g for _, g, _ in class_rows],
+    })
+    class_weights = np.array([w for _, _, w in class_rows])
+    fall_types = pd.DataFrame({"fall_type_id": [1, 2], "fall_type_name": ["Fell", "Found"]})
+
+    region_weights = np.array([w for *_, w in FIND_REGIONS], dtype=float)
+    region = rng.choice(len(FIND_REGIONS), rows, p=region_weights / region_weights.sum())
+    lat_bounds = np.array([r[1] for r in FIND_REGIONS])[region]
+    lon_bounds = np.array([r[2] for r in FIND_REGIONS])[region]
+    latitude = rng.uniform(lat_bounds[:, 0], lat_bounds[:, 1]).round(5)
+    longitude = rng.uniform(lon_bounds[:, 0], lon_bounds[:, 1]).round(5)
+    unlocated = rng.random(rows) < 0.1
+    locations = pd.DataFrame({
+        "location_id": np.arange(1, rows + 1),
+        "latitude": np.where(unlocated, np.nan, latitude),
+        "longitude": np.where(unlocated, np.nan, longitude),
+        "terrain_type": np.where(region == 0, "Ice Field",
+                                 np.where(region < 3, "Desert", rng.choice(TERRAIN_TYPES, rows))),
+    })
+
+    # Penemuan modern (ekspedisi Antartika / gurun) mendominasi
+    year = np.where(
+        rng.random(rows) < 0.8,
+        rng.normal(1995, 12, rows),
+        rng.uniform(860, 2023, rows),
+    ).clip(860, 2023).round()
+    year[rng.random(rows) < 0.02] = np.nan
+    mass = rng.lognormal(3.5, 2.3, rows).round(2)
+    mass[rng.random(rows) < 0.01] = np.nan
+    region_names = np.array([r[0] for r in FIND_REGIONS])[region]
+    meteorites = pd.DataFrame({
+        "meteorite_id": np.arange(1, rows + 1),
+        "name": [f"{place} {i:06d}" for i, place in enumerate(region_names.tolist(), start=1)],
+        "mass_gram": mass,
+        "year_discovered": year,
+        "classification_id": rng.choice(len(class_rows), rows, p=class_weights / class_weights.sum()) + 1,
+        "fall_type_id": np.where(rng.random(rows) < 0.03, 1, 2),
+        "location_id": np.arange(1, rows + 1),
+        "updated_at": "2024-01-01T00:00:00+00:00",
+    })
+
+    n_museums = 25
+    museums = pd.DataFrame({
+        "museum_id": np.arange(1, n_museums + 1),
+        "museum_name": [f"Natural History Museum {i}" for i in range(1, n_museums + 1)],
+        "city": rng.choice(["London", "Washington", "Paris", "Vienna", "Tokyo", "Jakarta"], n_museums),
+        "description": "Koleksi meteorit dan spesimen planet.",
+    })
+    n_specimens = max(100, rows // 10)
+    specimens = pd.DataFrame({
+        "specimen_id": np.arange(1, n_specimens + 1),
+        "meteorite_id": rng.integers(1, rows + 1, n_specimens),
+        "museum_id": rng.integers(1, n_museums + 1, n_specimens),
+        "specimen_mass_gram": rng.lognormal(3, 1.5, n_specimens).round(2),
+        "specimen_type": rng.choice(["Main mass", "Slice", "Fragment", "Thin section"], n_specimens),
+        "condition": rng.choice(["Excellent", "Good", "Fair", "Poor"], n_specimens, p=[0.3, 0.4, 0.2, 0.1]),
+    })
+    n_studies = 200
+    studies = pd.DataFrame({
+        "study_id": np.arange(1, n_studies + 1),
+        "status": rng.choice(["Published", "In Review", "Completed", "Ongoing"], n_studies),
+        "publication_year": rng.integers(1970, 2024, n_studies),
+        "journal": rng.choice(["Meteoritics & Planetary Science", "GCA", "EPSL", "Icarus", "Nature"], n_studies),
+    })
+    researchers = pd.DataFrame({
+        "researcher_id": np.arange(1, 41),
+        "name": [f"Dr. Researcher {i}" for i in range(1, 41)],
+        "specialization": rng.choice(["Petrology", "Cosmochemistry", "Mineralogy", "Geochronology"], 40),
+        "institution": rng.choice(["NASA JSC", "Smithsonian", "NIPR", "ITB"], 40),
+    })
+    n_expeditions = 30
+    expeditions = pd.DataFrame({
+        "expedition_id": np.arange(1, n_expeditions + 1),
+        "expedition_name": [f"ANSMET {1976 + i}" for i in range(n_expeditions)],
+    })
+    n_discoveries = max(50, rows // 50)
+    discoveries = pd.DataFrame({
+        "discovery_id": np.arange(1, n_discoveries + 1),
+        "expedition_id": rng.integers(1, n_expeditions + 1, n_discoveries),
+        "discovery_method": rng.choice(["Visual search", "Metal detector", "Systematic search"], n_discoveries),
+        "find_context": rng.choice(["Blue ice", "Desert pavement", "Farmland", "Moraine"], n_discoveries),
+        "discovery_date": (pd.Timestamp("1976-01-01")
+                           + pd.to_timedelta(rng.integers(0, 17_000, n_discoveries), unit="D")).strftime("%Y-%m-%d"),
+    })
+
+    return {
+        "meteorites": meteorites,
+        "meteorite_classifications": classifications,
+        "fall_types": fall_types,
+        "locations": locations,
+        "museums": museums,
+        "meteorite_specimens": specimens,
+        "research_studies": studies,
+        "researchers": researchers,
+        "discovery_expeditions": expeditions,
+        "meteorite_discoveries": discoveries,
+    }
+
+
+def _error(status, code, message):
+    return httpx.Response(status, json={"code": code, "message": message, "details": None, "hint": None})
+
+
+def _coerce(values, raw):
+    """Nilai filter dari query string -> tipe yang bisa dibandingkan dengan kolom"""
+    if values.dtype.kind in "iuf":
+        return float(raw)
+    return raw
+
+
+class FakePostgrest:
+    """
+    Handler httpx.MockTransport yang meniru PostgREST di atas {tabel: DataFrame}.
+    latency/jitter (detik) ditambahkan ke setiap request; max_rows meniru batas
+    baris per response Supabase.
+    """
+
+    def __init__(self, tables, latency=0.0, jitter=0.0, max_rows=1000):
+        self.tables = {name: df.reset_index(drop=True) for name, df in tables.items()}
+        self.latency = latency
+        self.jitter = jitter
+        self.max_rows = max_rows
+        self.requests = 0
+        self.bytes_sent = 0
+        self._views = {}
+        self._sorted = {}
+        self._lock = threading.Lock()
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def __call__(self, request):
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+        response = self._handle(request)
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += len(response.content)
+        return response
+
+    def _table(self, name):
+        if name in self.tables:
+            return self.tables[name]
+        for chart_name in CHART_QUERIES:
+            if view_name(chart_name) == name:
+                with self._lock:
+                    if name not in self._views:
+                        self._views[name] = aggregate_local(chart_name, self.tables)
+                return self._views[name]
+        return None
+
+    def _handle(self, request):
+        path = request.url.path.split("/rest/v1/", 1)[-1]
+        if path.startswith("rpc/"):
+            return self._rpc(path[4:], request)
+        df = self._table(path)
+        if df is None:
+            return _error(404, "42P01", f'relation "public.{path}" does not exist')
+
+        params = request.url.params
+        select = params.get("select", "*")
+        columns = list(df.columns) if select == "*" else select.split(",")
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            return _error(400, "42703", f"column {path}.{missing[0]} does not exist")
+
+        filters = [(k, v) for k, v in params.multi_items() if k not in ("select", "order", "limit", "offset")]
+        for column, _ in filters:
+            if column not in df.columns:
+                return _error(400, "42703", f"column {path}.{column} does not exist")
+        positions = self._select_rows(df, filters, params.get("order"))
+
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", self.max_rows))
+        if "range" in request.headers:
+            start, end = request.headers["range"].split("-")
+            offset, limit = int(start), int(end) - int(start) + 1
+        page = positions[offset:offset + min(limit, self.max_rows)]
+
+        prefer = request.headers.get("prefer", "")
+        total = str(len(positions)) if "count=" in prefer else "*"
+        content_range = f"{offset}-{offset + len(page) - 1}/{total}" if len(page) else f"*/{total}"
+        headers = {"content-range": content_range, "content-type": "application/json"}
+        if request.method == "HEAD":
+            return httpx.Response(200, headers=headers)
+        frame = df.iloc[page][columns]
+        records = frame.astype(object).where(frame.notna(), None).to_dict("records")
+        return httpx.Response(200, headers=headers, content=json.dumps(records, default=str))
+
+    def _sorted_column(self, df, column):
+        """True kalau kolom numerik, tanpa NULL dan sudah terurut naik (contoh: pk)"""
+        key = (id(df), column)
+        if key not in self._sorted:
+            values = df[column]
+            self._sorted[key] = (
+                values.dtype.kind in "iuf" and not values.hasnans and values.is_monotonic_increasing
+            )
+        return self._sorted[key]
+
+    def _select_rows(self, df, filters, order):
+        """
+        Posisi baris hasil WHERE + ORDER BY (numpy, tanpa copy frame).
+        Filter pembanding pada kolom terurut (pk) dipersempit dengan searchsorted,
+        jadi keyset pagination pada tabel 1 juta baris tidak men-scan seluruh tabel.
+        """
+        low, high = 0, len(df)
+        remaining = []
+        for column, expression in filters:
+            op, raw = expression.split(".", 1)
+            if op in ("gt", "gte", "lt", "lte") and self._sorted_column(df, column):
+                values = df[column].to_numpy()
+                bound = float(raw)
+                if op in ("gt", "gte"):
+                    low = max(low, int(np.searchsorted(values, bound, side="right" if op == "gt" else "left")))
+                else:
+                    high = min(high, int(np.searchsorted(values, bound, side="left" if op == "lt" else "right")))
+            else:
+                remaining.append((column, expression))
+        if low >= high:
+            return np.arange(0)
+
+        window = df.iloc[low:high]
+        mask = np.ones(high - low, dtype=bool)
+        for column, expression in remaining:
+            values = window[column]
+            negate = expression.startswith("not.")
+            if negate:
+                expression = expression[4:]
+            op, raw = expression.split(".", 1)
+            if op == "is":
+                matched = values.isna() if raw == "null" else values.notna()
+            elif op == "in":
+                options = raw.strip("()").split(",")
+                matched = values.astype(str).isin(options)
+            elif op in ("like", "ilike"):
+                pattern = raw.replace("*", "%").strip("%")
+                matched = values.astype(str).str.contains(pattern, case=op == "like", regex=False)
+            elif op in ("eq", "neq", "gt", "gte", "lt", "lte"):
+                value = _coerce(values, raw)
+                matched = {
+                    "eq": values == value, "neq": values != value,
+                    "gt": values > value, "gte": values >= value,
+                    "lt": values < value, "lte": values <= value,
+                }[op]
+            else:
+                raise ValueError(f"operator {op} belum didukung FakePostgrest")
+            matched = matched.fillna(False).to_numpy(dtype=bool)
+            mask &= ~matched if negate else matched
+        positions = low + np.flatnonzero(mask)
+
+        if order:
+            keys = [key.split(".") for key in order.split(",")]
+            if len(keys) == 1 and self._sorted_column(df, keys[0][0]):
+                # Urutan fisik sudah sama dengan ORDER BY kolom ini
+                return positions[::-1] if "desc" in keys[0][1:] else positions
+            for column, *flags in reversed(keys):
+                desc = "desc" in flags
+                # Postgres: ASC -> NULL di akhir, DESC -> NULL di awal
+                nulls_first = "nullsfirst" in flags or (desc and "nullslast" not in flags)
+                values = df[column].iloc[positions]
+                positions = values.sort_values(
+                    ascending=not desc, kind="stable",
+                    na_position="first" if nulls_first else "last",
+                ).index.to_numpy()
+        return positions
+
+    def _rpc(self, name, request):
+        if name != "table_counts":
+            return _error(404, "PGRST202", f"Could not find the function public.{name}")
+        body = json.loads(request.content or b"{}")
+        rows = [
+            {"table_name": table, "row_count": len(self.tables[table])}
+            for table in body.get("table_names", []) if table in self.tables
+        ]
+        return httpx.Response(200, json=rows)
+
+
+def fake_client(rows=10_000, latency=0.0, jitter=0.0, seed=0, tables=None):
+    """
+    Client supabase-py asli yang bicara ke FakePostgrest.
+    Return (client, backend) supaya counter request bisa dibaca.
+    """
+    backend = FakePostgrest(tables or generate_tables(rows, seed), latency=latency, jitter=jitter)
+    client = create_client(FAKE_URL, FAKE_KEY)
+    session = client.postgrest.session
+    client.postgrest.session = make_session(
+        session.base_url, session.headers, transport=httpx.MockTransport(backend)
+    )
+    # Supaya benchmark bisa membaca counter backend lewat init_supabase()
+    client.fake_backend = backend
+    return client, backend
@@ -0,0 +1,120 @@
+"""
+Figure cache: Plotly figure jadi dipakai ulang selama input sama
+
+Key = (chart id, data version, nilai widget yang relevan). Rerun yang tidak
+mengubah input sebuah chart langsung memakai objek go.Figure yang sama (tanpa
+plotly express / update_layout / parse JSON lagi); st.plotly_chart menerima
+Figure itu apa adanya, jadi satu-satunya biaya tersisa adalah serialisasi ke
+browser. Cache dibatasi total ukuran JSON figure (LRU).
+Figure di cache dipakai bersama semua session: JANGAN diubah setelah diambil.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+from meteor.perf import perf
+
+# Batas total JSON figure di memori (dibagi semua session)
+FIGURE_CACHE_MB = int(os.getenv("METEOR_FIGURE_CACHE_MB", "64"))
+
+# Template tema meteor, dibangun sekali: dasar template "plotly" + warna dashboard
+METEOR_TEMPLATE = go.layout.Template(pio.templates["plotly"])
+METEOR_TEMPLATE.layout.update(
+    paper_bgcolor='rgba(26, 26, 58, 0.8)',
+    plot_bgcolor='rgba(26, 26, 58, 0.8)',
+    font=dict(color='#d0d0ff'),
+    title_font=dict(color='#ff6b35'),
+    legend=dict(bgcolor='rgba(26, 26, 58, 0.8)', font=dict(color='#d0d0ff')),
+    xaxis=dict(gridcolor='rgba(255, 107, 53, 0.2)', tickfont=dict(color='#a0a0ff')),
+    yaxis=dict(gridcolor='rgba(255, 107, 53, 0.2)', tickfont=dict(color='#a0a0ff')),
+)
+
+
+def apply_meteor_theme(fig):
+    """Pasang template tema meteor (satu assignment, bukan update_layout per properti)"""
+    fig.update_layout(template=METEOR_TEMPLATE, title_text='')  # Hilangkan title undefined
+    return fig
+
+
+class FigureCache:
+    """LRU {key: go.Figure} dengan batas total byte (ukuran JSON figure)"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Figure untuk key (atau _NO_FIGURE), None kalau belum ada"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, fig, nbytes):
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (fig, nbytes)
+            self.size += nbytes
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.size, "hits": self.hits, "misses": self.misses}
+
+
+# Penanda "build() tidak menghasilkan figure" di cache
+_NO_FIGURE = object()
+
+figure_cache = FigureCache(FIGURE_CACHE_MB * 2 ** 20)
+perf.add_gauges("figure_cache", figure_cache.stats)
+
+
+def cached_figure(chart_id, key, build):
+    """
+    Figure untuk chart_id dengan input `key` (tuple hashable: data version +
+    nilai widget). build() -> go.Figure hanya dipanggil kalau belum ada di cache.
+    build() boleh return None (tidak ada data) -> None juga di-cache.
+    Figure yang dikembalikan dipakai bersama (read-only).
+    """
+    cache_key = (chart_id, *key)
+    fig = figure_cache.get(cache_key)
+    if fig is None:
+        with perf.timer(f"figure:{chart_id}"):
+            fig = build()
+            # Ukuran untuk budget cache dihitung sekali saat build
+            nbytes = 0 if fig is None else len(fig.to_json())
+        fig = _NO_FIGURE if fig is None else fig
+        figure_cache.put(cache_key, fig, nbytes)
+    return None if fig is _NO_FIGURE else fig
+
+
+def show_figure(fig):
+    """st.plotly_chart selebar kolom (waktu serialisasi tercatat sebagai render:plotly_chart)"""
+    with perf.timer("render:plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True)
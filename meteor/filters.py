@@ -0,0 +1,190 @@
+"""
+Filter engine untuk halaman Meteorites: index tahun terurut + bitmap per kategori
+
+Index dibangun sekali per data version dari fact table. Query filter hanya
+searchsorted di array tahun lalu AND beberapa bitmap, hasilnya posisi baris
+(tanpa copy / boolean mask DataFrame di setiap gerakan slider).
+
+Index juga menyimpan permutasi baris urut per kolom (mis. mass_gram menurun).
+Top-N / satu halaman tabel hasil filter cukup menelusuri permutasi itu
+sambil mengecek mask sampai baris yang dibutuhkan ketemu, tanpa sort ulang.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Kolom kategori yang bisa difilter dengan kesamaan (== nilai)
+BITMAP_COLUMNS = ("category", "fall_type_name", "class_group")
+
+
+class FilterResult:
+    """Hasil filter: posisi baris di fact table, kolom diambil hanya saat dibutuhkan"""
+
+    def __init__(self, index, mask):
+        self.index = index
+        self.mask = mask
+        self._rows = None
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            self._rows = np.flatnonzero(self.mask)
+        return self._rows
+
+    def __len__(self):
+        return int(self.mask.sum()) if self._rows is None else len(self._rows)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def column(self, name):
+        """Nilai satu kolom untuk baris hasil filter (numpy array)"""
+        return self.index.values(name)[self.rows]
+
+    def value_counts(self, name):
+        """value_counts kolom kategori lewat bincount kode (tanpa grup berjumlah 0)"""
+        codes, categories = self.index.codes(name)
+        selected = codes[self.rows]
+        counts = np.bincount(selected[selected >= 0], minlength=len(categories))
+        result = pd.Series(counts, index=categories, name="count")
+        return result[result > 0].sort_values(ascending=False, kind="stable")
+
+    def bin_counts(self, name, bins):
+        """Jumlah baris hasil filter per bin (lihat meteor.binning), bin kosong = 0"""
+        codes = self.index.bin_codes(name, bins)[self.rows]
+        return bins.series(bins.counts(codes))
+
+    def frame(self, columns=None):
+        """Materialisasi DataFrame (hanya kolom yang diminta)"""
+        return self.index.take(self.rows, columns)
+
+    def _walk(self, order, n):
+        """n posisi pertama di `order` yang lolos filter (blok makin besar, berhenti begitu cukup)"""
+        hits = []
+        found = 0
+        start = 0
+        block = max(4 * n, 1024)
+        while found < n and start < len(order):
+            chunk = order[start:start + block]
+            selected = chunk[self.mask[chunk]]
+            hits.append(selected)
+            found += len(selected)
+            start += block
+            block *= 2
+        return np.concatenate(hits)[:n] if hits else np.empty(0, dtype=np.int64)
+
+    def top(self, name, n, columns=None):
+        """Seperti frame().nlargest(n, name) (NaN dilewati, tie -> urutan baris)"""
+        return self.index.take(self._walk(self.index.order(name), n), columns)
+
+    def page(self, name, start, stop, descending=True, columns=None):
+        """
+        Baris ke-start..stop hasil filter, diurutkan menurut kolom `name`
+        (NULL di akhir). Hanya baris halaman itu yang dijadikan DataFrame.
+        """
+        rows = self._walk(self.index.order(name, descending), stop)
+        if len(rows) < stop:
+            rows = np.concatenate([rows, self._walk(self.index.nulls(name), stop - len(rows))])
+        return self.index.take(rows[start:stop], columns)
+
+
+class FilterIndex:
+    def __init__(self, facts):
+        self.facts = facts
+        self.size = len(facts)
+        self._values = {}
+        self._codes = {}
+        self._bin_codes = {}
+        self._orders = {}
+
+        years = self.values("year_discovered") if "year_discovered" in facts.columns else np.full(self.size, np.nan)
+        known = np.flatnonzero(~np.isnan(years))
+        order = np.argsort(years[known], kind="stable")
+        self._year_rows = known[order]
+        self._years_sorted = years[self._year_rows]
+
+        # Bitmap per nilai kategori: {kolom: {nilai: bool array}}
+        self._bitmaps = {}
+        for column in BITMAP_COLUMNS:
+            if column not in facts.columns:
+                continue
+            codes, categories = self.codes(column)
+            self._bitmaps[column] = {
+                value: codes == code for code, value in enumerate(categories)
+            }
+
+    def values(self, name):
+        """Kolom sebagai numpy array (NA -> NaN untuk kolom numerik), di-cache"""
+        if name not in self._values:
+            column = self.facts[name]
+            if pd.api.types.is_numeric_dtype(column):
+                self._values[name] = column.to_numpy(dtype="float64", na_value=np.nan)
+            else:
+                self._values[name] = column.to_numpy(dtype=object)
+        return self._values[name]
+
+    def codes(self, name):
+        """(kode kategori, daftar kategori) untuk kolom kategori"""
+        if name not in self._codes:
+            categorical = pd.Categorical(self.facts[name])
+            self._codes[name] = (np.asarray(categorical.codes), categorical.categories)
+        return self._codes[name]
+
+    def bin_codes(self, name, bins):
+        """Kode bin per baris untuk kolom numerik, dihitung sekali per data version"""
+        key = (name, bins.name)
+        if key not in self._bin_codes:
+            self._bin_codes[key] = bins.codes(self.values(name))
+        return self._bin_codes[key]
+
+    def order(self, name, descending=True):
+        """Posisi baris urut menurut kolom (NULL tidak ikut, tie -> urutan baris), di-cache"""
+        key = (name, descending)
+        if key not in self._orders:
+            values = self.values(name)
+            known = np.flatnonzero(~pd.isna(values))
+            values = values[known]
+            if values.dtype == object:
+                # String -> rank integer supaya urutan menurun tetap stabil
+                values = np.unique(values.astype(str), return_inverse=True)[1]
+            ranks = np.argsort(-values if descending else values, kind="stable")
+            self._orders[key] = known[ranks]
+        return self._orders[key]
+
+    def nulls(self, name):
+        """Posisi baris yang kolomnya NULL"""
+        return np.flatnonzero(pd.isna(self.values(name)))
+
+    def take(self, rows, columns=None):
+        """DataFrame untuk posisi baris `rows` (hanya kolom yang diminta)"""
+        if columns is None:
+            return self.facts.take(rows)
+        positions = [self.facts.columns.get_loc(c) for c in columns if c in self.facts.columns]
+        return self.facts.iloc[rows, positions]
+
+    def year_mask(self, low=None, high=None):
+        """Bitmap baris dengan low <= tahun <= high (tahun NULL tidak ikut)"""
+        start = 0 if low is None else np.searchsorted(self._years_sorted, low, side="left")
+        end = len(self._years_sorted) if high is None else np.searchsorted(self._years_sorted, high, side="right")
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self._year_rows[start:end]] = True
+        return mask
+
+    def query(self, year_range=None, **equals):
+        """
+        Filter gabungan, contoh: query((1900, 2023), category="Iron", fall_type_name="Fell").
+        Nilai None / "All" berarti kolom itu tidak difilter.
+        """
+        if year_range is None:
+            mask = np.ones(self.size, dtype=bool)
+        else:
+            mask = self.year_mask(*year_range)
+        for column, value in equals.items():
+            if value is None or value == "All":
+                continue
+            bitmap = self._bitmaps.get(column, {}).get(value)
+            if bitmap is None:
+                return FilterResult(self, np.zeros(self.size, dtype=bool))
+            mask &= bitmap
+        return FilterResult(self, mask)
@@ -0,0 +1,174 @@
+"""
+Instrumentasi ringan: waktu per stage + counter, panel sidebar & export
+
+Aktif kalau METEOR_PERF=1. Saat nonaktif, perf.timer() mengembalikan context
+kosong yang sama dan @timed langsung memanggil fungsi aslinya, jadi biayanya
+hanya satu pengecekan atribut per panggilan.
+
+Nama stage memakai prefix supaya mudah dikelompokkan:
+fetch:* / load:* (data), transform:* (fact table, index, query),
+figure:* (build figure), render:* (serialisasi ke browser), prefetch:* / page:*
+(satu rerun halaman).
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+import pandas as pd
+import streamlit as st
+
+PERF_ENABLED = os.getenv("METEOR_PERF", "") not in ("", "0")
+
+_NULL_TIMER = nullcontext()
+
+
+class _Timer:
+    __slots__ = ("recorder", "name", "start")
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class PerfRecorder:
+    """
+    {stage: [jumlah, total detik, max detik, detik terakhir]} + {counter: nilai}
+    untuk seluruh proses (semua session). Sumber gauge (mis. statistik table
+    store) didaftarkan dengan add_gauges dan dibaca saat snapshot.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._stages = {}
+        self._counters = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+
+    def timer(self, name):
+        """Context manager yang mencatat durasi blok sebagai stage `name`"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def record(self, name, seconds):
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                self._stages[name] = [1, seconds, seconds, seconds]
+            else:
+                stage[0] += 1
+                stage[1] += seconds
+                stage[2] = max(stage[2], seconds)
+                stage[3] = seconds
+
+    def incr(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def add_gauges(self, name, source):
+        """source() -> dict; nilai numeriknya ikut di snapshot sebagai {name}_{key}"""
+        self._gauges[name] = source
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def snapshot(self):
+        """Semua stage, counter dan gauge sebagai dict (siap JSON)"""
+        with self._lock:
+            stages = {
+                name: {"count": count, "total": total, "max": longest, "last": last}
+                for name, (count, total, longest, last) in self._stages.items()
+            }
+            counters = dict(self._counters)
+        gauges = {}
+        for prefix, source in self._gauges.items():
+            for key, value in source().items():
+                if isinstance(value, (int, float)):
+                    gauges[f"{prefix}_{key}"] = value
+        return {"stages": stages, "counters": counters, "gauges": gauges}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """Format text exposition Prometheus"""
+        report = self.snapshot()
+        lines = [
+            "# TYPE meteor_stage_seconds summary",
+            "# TYPE meteor_stage_seconds_max gauge",
+        ]
+        for name, stage in sorted(report["stages"].items()):
+            label = name.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'meteor_stage_seconds_sum{{stage="{label}"}} {stage["total"]:.6f}')
+            lines.append(f'meteor_stage_seconds_count{{stage="{label}"}} {stage["count"]}')
+            lines.append(f'meteor_stage_seconds_max{{stage="{label}"}} {stage["max"]:.6f}')
+        for name, value in sorted(report["counters"].items()):
+            lines.append(f"# TYPE meteor_{name}_total counter")
+            lines.append(f"meteor_{name}_total {value}")
+        for name, value in sorted(report["gauges"].items()):
+            lines.append(f"# TYPE meteor_{name} gauge")
+            lines.append(f"meteor_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+perf = PerfRecorder(enabled=PERF_ENABLED)
+
+
+def timed(name):
+    """Decorator: catat setiap panggilan fungsi sebagai stage `name`"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not perf.enabled:
+                return func(*args, **kwargs)
+            with _Timer(perf, name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_response(response):
+    """
+    Event hook httpx: hitung request & byte body yang diterima. Satuannya selalu
+    body setelah dekompresi (len(response.content)), untuk transport sungguhan
+    maupun meteor.fake, sama dengan kolom bytes di meteor.bench.
+    """
+    if not perf.enabled:
+        return
+    response.read()
+    perf.incr("http_requests")
+    perf.incr("http_bytes_received", len(response.content))
+
+
+def render_perf_panel():
+    """Panel sidebar: stage terlambat, counter, gauge + tombol export"""
+    if not perf.enabled:
+        return
+    report = perf.snapshot()
+    with st.sidebar.expander("⏱️ Performance", expanded=False):
+        if report["stages"]:
+            stages = pd.DataFrame.from_dict(report["stages"], orient="index")
+            stages = stages.sort_values("total", ascending=False)
+            st.dataframe(stages.round(4), use_container_width=True)
+        for name, value in sorted({**report["counters"], **report["gauges"]}.items()):
+            st.text(f"{name}: {value:,}")
+        st.download_button("JSON", perf.to_json(), file_name="meteor-perf.json", mime="application/json")
+        st.download_button("Prometheus", perf.to_prometheus(), file_name="meteor-perf.prom", mime="text/plain")
+        if st.button("Reset"):
+            perf.reset()
@@ -0,0 +1,122 @@
+"""
+Scheduler refresh di background (stale-while-revalidate)
+
+Setiap key yang terdaftar di-refresh ulang secara periodik oleh thread
+scheduler, sebelum TTL-nya habis, jadi pembaca selalu langsung mendapat data
+yang ada di memori dan tidak pernah menunggu reload dari Supabase.
+- interval per key (mis. tabel referensi jarang berubah -> lebih jarang)
+- jitter acak supaya refresh semua tabel tidak jatuh di detik yang sama
+- single-flight: satu key paling banyak satu refresh yang berjalan
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from meteor.perf import perf
+
+logger = logging.getLogger(__name__)
+
+# Refresh dijalankan setelah REFRESH_AHEAD x TTL (sebelum entry dianggap basi)
+REFRESH_AHEAD = 0.8
+# Variasi acak interval (+/- 10%)
+REFRESH_JITTER = 0.1
+# Refresh yang boleh jalan bersamaan (masing-masing sudah paralel di dalam)
+REFRESH_WORKERS = int(os.getenv("METEOR_REFRESH_WORKERS", "2"))
+
+
+class _Task:
+    __slots__ = ("refresh", "interval", "due")
+
+    def __init__(self, refresh, interval, due):
+        self.refresh = refresh
+        self.interval = interval
+        self.due = due
+
+
+class RefreshScheduler:
+    """{key: refresh()} yang dijalankan ulang setiap `interval` detik (+ jitter)"""
+
+    def __init__(self, workers=REFRESH_WORKERS, jitter=REFRESH_JITTER):
+        self.jitter = jitter
+        self.refreshes = 0
+        self.failures = 0
+        self._tasks = {}
+        self._running = set()
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="meteor-refresh")
+        self._thread = None
+
+    def _next_due(self, interval):
+        return time.time() + interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def schedule(self, key, refresh, interval):
+        """Daftarkan (atau ganti) refresh() untuk key, pertama kali setelah ~interval detik"""
+        with self._cond:
+            self._tasks[key] = _Task(refresh, interval, self._next_due(interval))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="meteor-scheduler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def cancel(self, key):
+        with self._cond:
+            self._tasks.pop(key, None)
+
+    def submit(self, key):
+        """Refresh key sekarang juga di background; False kalau tidak terdaftar / sedang jalan"""
+        with self._cond:
+            task = self._tasks.get(key)
+            if task is None or key in self._running:
+                return False
+            self._running.add(key)
+        self._pool.submit(self._run, key, task)
+        return True
+
+    def _run(self, key, task):
+        try:
+            with perf.timer("refresh"):
+                task.refresh()
+            self.refreshes += 1
+        except Exception as e:
+            # Data lama tetap dilayani; dicoba lagi di interval berikutnya
+            self.failures += 1
+            perf.incr("refresh_failures")
+            logger.warning("Refresh %s gagal: %s", key, e)
+        finally:
+            with self._cond:
+                self._running.discard(key)
+                task.due = self._next_due(task.interval)
+                self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                now = time.time()
+                waiting = [(task.due, key) for key, task in self._tasks.items() if key not in self._running]
+                if not waiting:
+                    self._cond.wait()
+                    continue
+                due, key = min(waiting, key=lambda item: item[0])
+                if due > now:
+                    self._cond.wait(due - now)
+                    continue
+                task = self._tasks[key]
+                self._running.add(key)
+            self._pool.submit(self._run, key, task)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "scheduled": len(self._tasks),
+                "running": len(self._running),
+                "refreshes": self.refreshes,
+                "failures": self.failures,
+            }
+
+
+scheduler = RefreshScheduler()
+perf.add_gauges("scheduler", scheduler.stats)
@@ -0,0 +1,94 @@
+"""
+Schema registry: kolom yang dipakai dashboard + dtype pandas yang ringkas
+"""
+
+import pandas as pd
+
+# Hanya kolom yang benar-benar dipakai halaman dashboard. fetch_data() mengirim
+# daftar ini sebagai select=..., jadi kolom lain tidak ikut lewat jaringan.
+#   Int16/Int32 -> integer nullable (id & tahun bisa NULL)
+#   float32     -> massa & koordinat (presisi 7 digit sudah cukup untuk tampilan)
+#   category    -> teks berulang di tabel besar
+#   object      -> teks bebas / tabel lookup kecil
+TABLE_SCHEMAS = {
+    "meteorites": {
+        "meteorite_id": "Int32",
+        "name": "object",
+        "mass_gram": "float32",
+        "year_discovered": "Int16",
+        "classification_id": "Int32",
+        "fall_type_id": "Int32",
+        "location_id": "Int32",
+    },
+    "meteorite_classifications": {
+        "classification_id": "Int32",
+        "category": "object",
+        "class_group": "object",
+    },
+    "fall_types": {
+        "fall_type_id": "Int32",
+        "fall_type_name": "object",
+    },
+    "locations": {
+        "location_id": "Int32",
+        "latitude": "float32",
+        "longitude": "float32",
+        "terrain_type": "category",
+    },
+    "museums": {
+        "museum_id": "Int32",
+        "museum_name": "object",
+        "city": "object",
+        "description": "object",
+    },
+    "meteorite_specimens": {
+        "museum_id": "Int32",
+        "specimen_mass_gram": "float32",
+        "specimen_type": "category",
+        "condition": "category",
+    },
+    "research_studies": {
+        "status": "category",
+        "publication_year": "Int16",
+        "journal": "category",
+    },
+    "researchers": {
+        "name": "object",
+        "specialization": "object",
+        "institution": "object",
+    },
+    "discovery_expeditions": {
+        "expedition_id": "Int32",
+        "expedition_name": "object",
+    },
+    "meteorite_discoveries": {
+        "expedition_id": "Int32",
+        "discovery_method": "category",
+        "find_context": "category",
+        "discovery_date": "object",
+    },
+}
+
+_NUMERIC_DTYPES = ("Int16", "Int32", "Int64", "float32", "float64")
+
+
+def table_columns(table_name):
+    """Daftar kolom terdaftar untuk tabel, atau None kalau tabel belum ada di registry"""
+    schema = TABLE_SCHEMAS.get(table_name)
+    return list(schema) if schema else None
+
+
+def apply_schema(df, table_name):
+    """Konversi kolom ke dtype registry (in-place pada frame baru hasil fetch)"""
+    for column, dtype in TABLE_SCHEMAS.get(table_name, {}).items():
+        if column not in df.columns:
+            continue
+        if dtype in _NUMERIC_DTYPES:
+            values = pd.to_numeric(df[column], errors="coerce")
+            if dtype.startswith("Int"):
+                # Int* nullable tidak menerima pecahan -> bulatkan dulu
+                values = values.round()
+            df[column] = values.astype(dtype)
+        elif dtype != "object":
+            df[column] = df[column].astype(dtype)
+    return df
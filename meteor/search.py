@@ -0,0 +1,127 @@
+"""
+Index pencarian nama meteorit: prefix (array terurut) + trigram (inverted index)
+
+Dibangun sekali per data version, seluruhnya dengan operasi numpy:
+- prefix  : nama ternormalisasi diurutkan, lookup = dua searchsorted
+- trigram : pasangan (trigram, baris) diurutkan jadi CSR, jadi setiap trigram
+            query langsung menunjuk ke daftar barisnya
+Pencarian fuzzy menghitung trigram yang sama per kandidat (bincount), jadi
+salah ketik 1-2 huruf tetap ketemu tanpa scan str.contains atas seluruh frame.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Minimal porsi trigram query yang harus ada di nama supaya dianggap cocok
+MIN_COVERAGE = 0.5
+
+
+def normalize(text):
+    """Huruf kecil, spasi berlebih dirapikan"""
+    return " ".join(str(text).lower().split())
+
+
+def _char_matrix(names):
+    """Nama dengan padding "  nama " sebagai matriks kode unicode (0 = di luar nama)"""
+    padded = np.array(["  " + name + " " for name in names], dtype=str)
+    return padded.view(np.uint32).reshape(len(padded), padded.itemsize // 4)
+
+
+def _run_starts(values):
+    """Bitmap elemen pertama setiap run nilai sama (values sudah terurut)"""
+    starts = np.ones(len(values), dtype=bool)
+    starts[1:] = values[1:] != values[:-1]
+    return starts
+
+
+class NameIndex:
+    def __init__(self, names):
+        """names: nama per baris fact table (posisi baris = hasil pencarian)"""
+        names = [normalize(name) if isinstance(name, str) else "" for name in names]
+        self.size = len(names)
+
+        # Prefix: nama terurut + posisi barisnya
+        normalized = np.array(names, dtype=str)
+        self._prefix_order = np.argsort(normalized, kind="stable").astype(np.int64)
+        self._sorted_names = normalized[self._prefix_order]
+
+        # Trigram: CSR {trigram: baris}; trigram yang sama dalam satu nama dihitung sekali
+        chars = _char_matrix(names)
+        self._alphabet = np.unique(chars[chars > 0])
+        rows, trigrams = self._trigrams(chars)
+        # (sort + buang duplikat manual; np.unique di sini jauh lebih lambat)
+        pairs = np.sort(trigrams << 32 | rows)
+        pairs = pairs[_run_starts(pairs)]
+        self._rows = pairs & 0xFFFFFFFF
+        keys = pairs >> 32
+        starts = np.flatnonzero(_run_starts(keys))
+        self._keys = keys[starts]
+        self._offsets = np.append(starts, len(pairs))
+        self._trigram_counts = np.bincount(self._rows, minlength=self.size)
+
+    def _trigrams(self, chars):
+        """(baris, kode trigram) untuk matriks dari _char_matrix"""
+        # Kode huruf: 1..len(alphabet), huruf di luar alphabet = len(alphabet) + 1
+        # (tidak pernah ada di index), 0 = padding array fixed-width
+        position = np.searchsorted(self._alphabet, chars)
+        known = self._alphabet[np.minimum(position, len(self._alphabet) - 1)] == chars
+        codes = np.where(known, position + 1, len(self._alphabet) + 1).astype(np.int64)
+        codes[chars == 0] = 0
+        base = len(self._alphabet) + 2
+        trigrams = (codes[:, :-2] * base + codes[:, 1:-1]) * base + codes[:, 2:]
+        valid = codes[:, 2:] > 0
+        rows = np.broadcast_to(np.arange(len(chars), dtype=np.int64)[:, None], trigrams.shape)
+        return rows[valid], trigrams[valid]
+
+    def prefix(self, query, limit=None):
+        """Posisi baris yang namanya diawali query (urut nama)"""
+        query = normalize(query)
+        start = np.searchsorted(self._sorted_names, query, side="left")
+        stop = np.searchsorted(self._sorted_names, query + "\uffff", side="left")
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return self._prefix_order[start:stop]
+
+    def fuzzy(self, query):
+        """(posisi baris, skor 0..1) kandidat yang berbagi cukup trigram dengan query"""
+        query = normalize(query)
+        if not query or not len(self._keys):
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        trigrams = np.unique(self._trigrams(_char_matrix([query]))[1])
+        slots = np.minimum(np.searchsorted(self._keys, trigrams), len(self._keys) - 1)
+        slots = slots[self._keys[slots] == trigrams]
+        if not len(slots):
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        postings = np.concatenate([self._rows[self._offsets[i]:self._offsets[i + 1]] for i in slots])
+        shared = np.bincount(postings, minlength=self.size)
+        candidates = np.flatnonzero(shared >= max(1, int(np.ceil(len(trigrams) * MIN_COVERAGE))))
+        matched = shared[candidates]
+        # Porsi trigram query yang ketemu, dibedakan lagi dengan Jaccard
+        # (nama yang panjangnya mirip query naik ke atas)
+        coverage = matched / len(trigrams)
+        jaccard = matched / (len(trigrams) + self._trigram_counts[candidates] - matched)
+        return candidates, (coverage + jaccard) / 2
+
+    def search(self, query, limit=20):
+        """
+        DataFrame row (posisi baris fact table) + score, terurut: nama yang
+        diawali query dulu (skor 1), lalu kandidat fuzzy dengan skor tertinggi.
+        """
+        if not normalize(query):
+            return pd.DataFrame({"row": np.empty(0, dtype=np.int64), "score": np.empty(0)})
+        prefix_rows = self.prefix(query, limit)
+        if len(prefix_rows) >= limit:
+            # Sudah penuh oleh prefix, kandidat fuzzy tidak akan tampil
+            return pd.DataFrame({"row": prefix_rows, "score": np.ones(len(prefix_rows))})
+        candidates, scores = self.fuzzy(query)
+        keep = ~np.isin(candidates, prefix_rows)
+        candidates, scores = candidates[keep], scores[keep]
+        n = limit - len(prefix_rows)
+        if len(candidates) > n:
+            best = np.argpartition(-scores, n)[:n] if n > 0 else np.empty(0, dtype=np.int64)
+            candidates, scores = candidates[best], scores[best]
+        order = np.lexsort((candidates, -scores))
+        return pd.DataFrame({
+            "row": np.concatenate([prefix_rows, candidates[order]]),
+            "score": np.concatenate([np.ones(len(prefix_rows)), scores[order]]),
+        })
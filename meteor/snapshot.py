@@ -0,0 +1,142 @@
+"""
+Snapshot lokal (Arrow IPC) supaya restart / TTL habis tidak perlu reload dari Supabase
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow ikut terpasang bersama streamlit, tapi jaga-jaga
+    pa = None
+
+from meteor.db import backend_id
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = os.getenv("METEOR_SNAPSHOT_DIR", ".snapshots")
+# Snapshot lebih tua dari ini tetap dipakai, tapi ditandai basi supaya
+# table store langsung merevalidasinya lewat scheduler
+SNAPSHOT_MAX_AGE = int(os.getenv("METEOR_SNAPSHOT_MAX_AGE", "300"))
+
+
+def snapshot_path(table_name, columns=None):
+    """
+    File snapshot per backend + tabel + daftar kolom (projection berbeda = file
+    berbeda). Backend ikut di nama file supaya data meteor.fake tidak pernah
+    terbaca sebagai snapshot project Supabase sungguhan (atau sebaliknya).
+    """
+    signature = ",".join(columns) if columns else "*"
+    digest = hashlib.sha1(signature.encode()).hexdigest()[:8]
+    return os.path.join(SNAPSHOT_DIR, f"{table_name}-{backend_id()}-{digest}.arrow")
+
+
+def write_snapshot(table_name, columns, df, state=None, version=None):
+    """
+    Tulis DataFrame ke Arrow IPC (atomic rename), return version stamp.
+    `state` = state sync incremental (lihat meteor.sync), disimpan di metadata.
+    version=None -> version baru; isi sama dengan snapshot lama -> berikan version lamanya.
+    """
+    if pa is None:
+        return None
+    fetched_at = time.time()
+    version = version or f"{time.time_ns():x}"
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    meta = dict(table.schema.metadata or {})
+    meta[b"meteor"] = json.dumps({
+        "table": table_name,
+        "version": version,
+        "fetched_at": fetched_at,
+        "rows": len(df),
+        "state": state,
+    }).encode()
+    table = table.replace_schema_metadata(meta)
+
+    path = snapshot_path(table_name, columns)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        # Tanpa kompresi supaya bisa di-memory-map langsung saat dibaca
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Gagal menulis snapshot %s: %s", path, e)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
+    return version
+
+
+def read_snapshot(table_name, columns=None):
+    """Memory-map snapshot dari disk -> (DataFrame, meta) atau None kalau belum ada"""
+    if pa is None:
+        return None
+    path = snapshot_path(table_name, columns)
+    if not os.path.exists(path):
+        return None
+    try:
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+            meta = json.loads(table.schema.metadata[b"meteor"])
+            return table.to_pandas(), meta
+    except (OSError, KeyError, ValueError, pa.ArrowInvalid) as e:
+        logger.warning("Snapshot %s rusak, diabaikan: %s", path, e)
+        return None
+
+
+def load_with_snapshot(table_name, columns, loader):
+    """
+    Snapshot ada -> langsung dipakai (mmap). Snapshot yang lebih tua dari
+    SNAPSHOT_MAX_AGE ditandai df.attrs["stale"] = True; revalidasinya dijalankan
+    table store lewat scheduler (refresh_snapshot), bukan di sini.
+    Snapshot belum ada -> load dari network sekali, lalu disimpan.
+
+    loader() -> (df, state) : load penuh
+    Version stamp snapshot disimpan di df.attrs["version"] (lihat data_version).
+    """
+    snapshot = read_snapshot(table_name, columns)
+    if snapshot is None:
+        df, state = loader()
+        version = write_snapshot(table_name, columns, df, state)
+        # Snapshot gagal ditulis -> tetap beri version unik untuk load ini
+        df.attrs["version"] = version or f"mem-{time.time_ns():x}"
+        return df
+
+    df, meta = snapshot
+    df.attrs["version"] = meta["version"]
+    if time.time() - meta["fetched_at"] > SNAPSHOT_MAX_AGE:
+        df.attrs["stale"] = True
+    return df
+
+
+def refresh_snapshot(table_name, columns, loader, refresher=None):
+    """
+    Revalidasi snapshot sekarang juga (dipanggil dari thread scheduler) -> DataFrame
+    terbaru. Kalau refresher tidak menemukan perubahan (frame yang sama
+    dikembalikan), version lama dipertahankan supaya cache turunan (fact table,
+    index, figure) tidak dibangun ulang.
+    """
+    snapshot = read_snapshot(table_name, columns)
+    if snapshot is None or refresher is None:
+        df, state = loader()
+        version = write_snapshot(table_name, columns, df, state)
+    else:
+        old, meta = snapshot
+        df, state = refresher(old, meta.get("state"))
+        version = write_snapshot(
+            table_name, columns, df, state,
+            version=meta["version"] if df is old else None,
+        )
+    df.attrs["version"] = version or f"mem-{time.time_ns():x}"
+    return df
+
+
+def data_version(df):
+    """Version data sebuah frame hasil fetch_data (kunci cache untuk hasil turunan)"""
+    return df.attrs.get("version") or f"rows-{len(df)}-{id(df):x}"
@@ -0,0 +1,172 @@
+"""
+Level-of-detail grid untuk globe: meteorit dikelompokkan per sel quadtree lat/lon
+
+Level L membagi bumi jadi sel persegi selebar 180 / 2**L derajat
+(2**L baris x 2**(L+1) kolom). Agregasi per level dihitung sekali per data
+version; globe memakai level paling detail yang jumlah titiknya masih muat
+di budget, jadi semua meteorit terwakili (tidak ada yang dibuang seperti sample()).
+
+density_grid() memakai data yang sama untuk heatmap: histogram2d seluruh titik
+ke grid tetap, jadi payload ke browser = jumlah sel, bukan jumlah baris.
+"""
+
+import numpy as np
+import pandas as pd
+
+# 180 / 2**10 ~ 0.18 derajat (~20 km) -> praktis setiap sel berisi satu lokasi
+MAX_LEVEL = 10
+
+# Bobot density grid: count -> 1 per meteorit, log_mass -> log10(massa + 1)
+DENSITY_WEIGHTS = ("count", "log_mass")
+
+
+def gaussian_smooth(grid, sigma):
+    """
+    Blur Gaussian separable (sigma dalam satuan sel). Sumbu longitude
+    dianggap melingkar (180 = -180), sumbu latitude di-pad nol.
+    """
+    if sigma <= 0:
+        return grid
+    radius = int(np.ceil(3 * sigma))
+    offsets = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+    kernel /= kernel.sum()
+
+    smoothed = np.zeros_like(grid)
+    for offset, weight in zip(offsets, kernel):
+        smoothed += weight * np.roll(grid, offset, axis=1)
+    padded = np.pad(smoothed, ((radius, radius), (0, 0)))
+    result = np.zeros_like(grid)
+    for offset, weight in zip(offsets, kernel):
+        result += weight * padded[radius + offset:radius + offset + grid.shape[0]]
+    return result
+
+
+class SpatialIndex:
+    def __init__(self, facts):
+        self.facts = facts
+        lat = facts["latitude"].to_numpy(dtype="float64", na_value=np.nan)
+        lon = facts["longitude"].to_numpy(dtype="float64", na_value=np.nan)
+        located = ~(np.isnan(lat) | np.isnan(lon))
+        # Posisi baris fact table yang punya koordinat
+        self.rows = np.flatnonzero(located)
+        self.lat = lat[located]
+        self.lon = lon[located]
+        mass = facts["mass_gram"].to_numpy(dtype="float64", na_value=np.nan)[located]
+        self.mass = np.where(mass > 0, mass, 0.0)
+        # Bobot heatmap mode massa: log10(massa + 1), massa kosong dianggap 1 g
+        self.log_mass = np.log10(np.where(np.isnan(mass), 1.0, np.maximum(mass, 0.0)) + 1)
+        self._clusters = {}
+        self._grids = {}
+        self._hover = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def cell_ids(self, level):
+        """Id sel quadtree (baris * jumlah kolom + kolom) untuk setiap titik"""
+        size = 180.0 / 2 ** level
+        n_rows, n_cols = 2 ** level, 2 ** (level + 1)
+        iy = np.clip(((self.lat + 90.0) // size).astype(np.int64), 0, n_rows - 1)
+        ix = np.clip(((self.lon + 180.0) // size).astype(np.int64), 0, n_cols - 1)
+        return iy * n_cols + ix
+
+    def clusters(self, level):
+        """
+        Agregasi per sel (di-cache per level):
+        cell, count, total_mass, latitude/longitude (centroid), point (posisi
+        titik kalau sel hanya berisi satu meteorit, selain itu -1)
+        """
+        if level not in self._clusters:
+            cells, inverse, counts = np.unique(
+                self.cell_ids(level), return_inverse=True, return_counts=True
+            )
+            first = np.full(len(cells), len(self.rows), dtype=np.int64)
+            np.minimum.at(first, inverse, np.arange(len(self.rows)))
+            self._clusters[level] = pd.DataFrame({
+                "cell": cells,
+                "count": counts,
+                "total_mass": np.bincount(inverse, weights=self.mass, minlength=len(cells)),
+                "latitude": np.bincount(inverse, weights=self.lat, minlength=len(cells)) / counts,
+                "longitude": np.bincount(inverse, weights=self.lon, minlength=len(cells)) / counts,
+                "point": np.where(counts == 1, first, -1),
+            })
+        return self._clusters[level]
+
+    def density_grid(self, cell_size=1.0, weights="count", sigma=0.0):
+        """
+        Heatmap seluruh titik sebagai grid (histogram2d), di-cache per
+        (cell_size, weights, sigma). Hanya sel yang berisi yang dikembalikan:
+        DataFrame latitude, longitude (pusat sel), z.
+        """
+        key = (cell_size, weights, sigma)
+        if key not in self._grids:
+            if weights not in DENSITY_WEIGHTS:
+                raise ValueError(f"weights harus salah satu dari {DENSITY_WEIGHTS}, bukan {weights!r}")
+            lat_edges = np.linspace(-90, 90, int(round(180 / cell_size)) + 1)
+            lon_edges = np.linspace(-180, 180, int(round(360 / cell_size)) + 1)
+            grid, _, _ = np.histogram2d(
+                self.lat, self.lon, bins=(lat_edges, lon_edges),
+                weights=None if weights == "count" else self.log_mass,
+            )
+            grid = gaussian_smooth(grid, sigma)
+            # Ekor kernel yang praktis nol tidak ikut dikirim
+            iy, ix = np.nonzero(grid > grid.max(initial=0.0) * 1e-3)
+            self._grids[key] = pd.DataFrame({
+                "latitude": (lat_edges[iy] + lat_edges[iy + 1]) / 2,
+                "longitude": (lon_edges[ix] + lon_edges[ix + 1]) / 2,
+                "z": grid[iy, ix],
+            })
+        return self._grids[key]
+
+    def hover_frame(self):
+        """
+        Data hover untuk setiap titik (name, mass_gram, mass_kg, mass_known,
+        year_display, latitude, longitude), disiapkan sekali per data version lalu
+        cukup di-take. Massa tidak diformat di Python: angka mentah dikirim di
+        customdata dan diformat oleh hovertemplate Plotly (mass_known memilih
+        template dengan label "Unknown").
+        """
+        if self._hover is None:
+            facts = self.facts
+            mass = facts["mass_gram"].to_numpy(dtype="float64", na_value=np.nan)[self.rows]
+            known = mass > 0
+
+            years = facts["year_discovered"].to_numpy(dtype="float64", na_value=np.nan)[self.rows]
+            year_display = np.full(len(years), "Unknown", dtype=object)
+            dated = ~np.isnan(years)
+            year_display[dated] = years[dated].astype(np.int64).astype(str)
+
+            self._hover = pd.DataFrame({
+                "name": facts["name"].to_numpy(dtype=object)[self.rows],
+                "mass_gram": np.where(known, mass, np.nan),
+                "mass_kg": np.where(known, mass / 1000, np.nan),
+                "mass_known": known,
+                "year_display": year_display,
+                "latitude": self.lat,
+                "longitude": self.lon,
+            })
+        return self._hover
+
+    def level_for(self, max_points):
+        """Level paling detail yang jumlah selnya <= max_points (minimal level 0)"""
+        level = 0
+        for candidate in range(1, MAX_LEVEL + 1):
+            if len(self.clusters(candidate)) > max_points:
+                break
+            level = candidate
+        return level
+
+    def view(self, max_points):
+        """
+        (level, singles, groups) untuk budget titik:
+        singles -> hover_frame() untuk sel berisi satu meteorit (digambar individual)
+        groups  -> sel berisi banyak meteorit (digambar sebagai cluster + jumlah)
+        """
+        level = self.level_for(max_points)
+        clusters = self.clusters(level)
+        points = clusters["point"].to_numpy()
+        single = points >= 0
+        singles = self.hover_frame().take(points[single])
+        groups = clusters[~single].reset_index(drop=True)
+        return level, singles, groups
@@ -0,0 +1,197 @@
+"""
+Table store bersama untuk semua session: satu salinan per tabel per proses
+
+st.cache_data meng-unpickle DataFrame baru untuk setiap pemanggil. Store ini
+menyimpan frame sekali dan membagikan shallow copy (zero-copy, data dipakai
+bersama). Copy-on-write pandas diaktifkan supaya perubahan di satu session
+tidak bocor ke frame bersama. Ukuran dibatasi budget memori (LRU).
+
+Entry tidak pernah dibuang karena TTL: setelah load pertama, key didaftarkan
+ke meteor.scheduler yang me-refresh-nya di background sebelum TTL habis.
+Entry yang terlanjur basi tetap dilayani (stale-while-revalidate).
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from meteor.perf import perf
+from meteor.scheduler import REFRESH_AHEAD, scheduler
+
+logger = logging.getLogger(__name__)
+
+# Shallow copy hanya aman kalau penulisan selalu meng-copy dulu
+pd.set_option("mode.copy_on_write", True)
+
+# Budget memori store (semua tabel, semua session)
+STORE_BUDGET_MB = int(os.getenv("METEOR_STORE_MB", "512"))
+# Umur entry sebelum dianggap basi (default; bisa per key, lihat get_or_load)
+STORE_TTL = int(os.getenv("METEOR_STORE_TTL", "300"))
+
+
+class _Entry:
+    __slots__ = ("frame", "nbytes", "loaded_at", "ttl")
+
+    def __init__(self, frame, nbytes, loaded_at, ttl):
+        self.frame = frame
+        self.nbytes = nbytes
+        self.loaded_at = loaded_at
+        self.ttl = ttl
+
+    def stale(self):
+        return self.ttl is not None and time.time() - self.loaded_at > self.ttl
+
+
+def frame_nbytes(df):
+    """Perkiraan memori frame / Series (termasuk isi string kolom object)"""
+    return int(np.sum(df.memory_usage(deep=True, index=True)))
+
+
+class TableStore:
+    """LRU {key: DataFrame} dengan batas byte, TTL dan counter hit/miss/evict"""
+
+    def __init__(self, max_bytes, ttl=None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Satu loader per key: session lain menunggu hasilnya, tidak ikut load
+        self._loading = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, key):
+        """Entry untuk key (boleh basi) atau None; panggil dengan _lock"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key):
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            stale = entry.stale()
+            if stale:
+                self.stale_hits += 1
+        if stale:
+            # Scheduler terlambat / refresh gagal: tetap layani data lama,
+            # revalidasi di background (pembaca tidak menunggu)
+            scheduler.submit(key)
+        return entry.frame.copy(deep=False)
+
+    def put(self, key, df, ttl=None):
+        """
+        Simpan frame (jadi read-only bersama), evict LRU sampai muat di budget.
+        Return False kalau frame lebih besar dari seluruh budget (tidak disimpan).
+        """
+        nbytes = frame_nbytes(df)
+        stored = nbytes <= self.max_bytes
+        evicted_keys = []
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old.nbytes
+            if not stored:
+                logger.warning("Frame %s (%d bytes) melebihi budget store, tidak disimpan", key, nbytes)
+                evicted_keys.append(key)
+            else:
+                self._entries[key] = _Entry(df, nbytes, time.time(), self.ttl if ttl is None else ttl)
+                self.size += nbytes
+            while self.size > self.max_bytes:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.nbytes
+                self.evictions += 1
+                evicted_keys.append(evicted_key)
+        # Key yang sudah tidak disimpan tidak perlu di-refresh lagi
+        for evicted_key in evicted_keys:
+            scheduler.cancel(evicted_key)
+        return stored
+
+    def get_or_load(self, key, loader, ttl=None, refresh=None):
+        """
+        View zero-copy frame untuk key. Saat miss, loader() -> DataFrame dipanggil
+        sekali (session lain menunggu hasilnya), lalu key didaftarkan ke scheduler:
+        refresh() (default loader) dijalankan di background setiap
+        REFRESH_AHEAD x ttl detik dan hasilnya menggantikan entry. Loader boleh
+        menandai frame-nya basi (attrs["stale"], mis. snapshot disk yang lama):
+        frame itu tetap dilayani, refresh() langsung di-submit ke scheduler.
+        """
+        frame = self.get(key)
+        if frame is not None:
+            return frame
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                # Mungkin sudah dimuat session lain selagi menunggu lock
+                entry = self._lookup(key)
+            if entry is not None:
+                return entry.frame.copy(deep=False)
+            frame = loader()
+            stale = frame.attrs.pop("stale", False)
+            # Frame yang tidak muat di store tidak didaftarkan ke scheduler
+            # (refresh-nya hanya akan dibuang lagi)
+            if self.put(key, frame, ttl):
+                self._schedule(key, refresh or loader, self.ttl if ttl is None else ttl)
+                if stale:
+                    scheduler.submit(key)
+        return frame.copy(deep=False)
+
+    def _schedule(self, key, refresh, ttl):
+        if ttl is None:
+            return
+
+        def revalidate():
+            with self._lock:
+                # Entry sudah di-evict / clear -> tidak perlu reload sama sekali
+                if key not in self._entries:
+                    return
+            frame = refresh()
+            with self._lock:
+                # Di-evict / clear selama refresh -> jangan dihidupkan lagi
+                if key not in self._entries:
+                    return
+            self.put(key, frame, ttl)
+
+        scheduler.schedule(key, revalidate, ttl * REFRESH_AHEAD)
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self.size = 0
+        for key in keys:
+            scheduler.cancel(key)
+
+    def stats(self):
+        """Counter untuk monitoring"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "budget_bytes": self.max_bytes,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "tables": {str(key): entry.nbytes for key, entry in self._entries.items()},
+            }
+
+
+table_store = TableStore(STORE_BUDGET_MB * 2 ** 20, ttl=STORE_TTL)
+perf.add_gauges("table_store", table_store.stats)
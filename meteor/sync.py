@@ -0,0 +1,138 @@
+"""
+Incremental delta sync: hanya ambil baris baru/berubah sejak high-water mark terakhir
+"""
+
+import os
+import time
+
+import pandas as pd
+from postgrest.exceptions import APIError
+
+from meteor.db import (
+    TABLE_PRIMARY_KEYS,
+    column_bound,
+    head_count,
+    load_table_pages,
+    pages_to_frame,
+    walk_key_range,
+)
+from meteor.schema import apply_schema
+
+# Kolom timestamp yang di-update trigger database setiap kali baris berubah.
+# Tabel yang tidak punya kolom ini otomatis memakai primary key (append-only).
+CHANGE_COLUMN = "updated_at"
+# Rekonsiliasi penuh daftar primary key (deteksi baris terhapus) paling lama tiap:
+RECONCILE_INTERVAL = int(os.getenv("METEOR_RECONCILE_INTERVAL", "3600"))
+
+# Tabel yang ketahuan tidak punya CHANGE_COLUMN (cache per proses)
+_no_change_column = set()
+# Kode error Postgres untuk kolom yang tidak ada (undefined_column)
+_MISSING_COLUMN_CODES = ("42703",)
+
+
+def _high_water_mark(client, table_name, pk):
+    """(kolom, nilai maksimum) yang dipakai sebagai penanda sync"""
+    if table_name not in _no_change_column:
+        try:
+            return CHANGE_COLUMN, column_bound(client, table_name, CHANGE_COLUMN, desc=True)
+        except APIError as e:
+            # Hanya "kolom tidak ada" yang diingat; error lain (timeout, 5xx, JWT)
+            # diteruskan -> full_load kali ini tanpa state, dicoba lagi berikutnya
+            if e.code not in _MISSING_COLUMN_CODES:
+                raise
+            _no_change_column.add(table_name)
+    return pk, column_bound(client, table_name, pk, desc=True)
+
+
+def _frame_columns(columns, pk):
+    """Frame hasil sync selalu membawa pk supaya bisa di-upsert"""
+    if not columns:
+        return None
+    return columns if pk in columns else columns + [pk]
+
+
+def full_load(client, table_name, columns=None):
+    """
+    Load penuh -> (DataFrame, state). state berisi high-water mark untuk
+    delta_sync berikutnya, atau None kalau tabel tidak bisa di-sync incremental.
+    """
+    pk = TABLE_PRIMARY_KEYS.get(table_name)
+    state = None
+    if pk is not None:
+        try:
+            # Diambil SEBELUM load, jadi baris yang berubah selama load tetap
+            # ikut terambil di delta berikutnya (upsert idempotent)
+            column, mark = _high_water_mark(client, table_name, pk)
+            state = {"column": column, "hwm": mark, "reconciled_at": time.time()}
+        except APIError:
+            state = None
+
+    # load_table_pages sudah menambahkan pk ke select untuk keyset pagination
+    pages = load_table_pages(client, table_name, columns=columns)
+    df = pages_to_frame(pages)
+    if pk is None or pk not in df.columns:
+        # pk tidak ada di tabel (fallback offset pagination) -> selalu load penuh
+        state = None
+    wanted = _frame_columns(columns, pk) if state else columns
+    if wanted:
+        df = df.reindex(columns=wanted)
+    return apply_schema(df, table_name), state
+
+
+def upsert_rows(df, delta, pk, table_name):
+    """Ganti baris lama dengan versi baru (berdasarkan pk), tambah baris baru"""
+    if delta.empty:
+        return df
+    kept = df[~df[pk].isin(delta[pk])]
+    merged = pd.concat([kept, delta.reindex(columns=df.columns)], ignore_index=True)
+    # concat kategori dengan categories berbeda -> object, jadi dtype diset ulang
+    return apply_schema(merged.sort_values(pk, ignore_index=True), table_name)
+
+
+def _remote_keys(client, table_name, pk):
+    """Semua primary key di server (select pk saja, payload kecil)"""
+    pages = walk_key_range(client, table_name, pk, columns=pk)
+    return pages_to_frame(pages, [pk])[pk]
+
+
+def delta_sync(client, table_name, columns, df, state):
+    """
+    Update frame cache secara incremental -> (DataFrame, state).
+
+    1. Ambil baris dengan CHANGE_COLUMN (atau pk) > high-water mark, upsert.
+    2. Checksum murah: COUNT server vs jumlah baris lokal. Kalau beda, atau
+       RECONCILE_INTERVAL sudah lewat, daftar pk dicocokkan untuk membuang
+       baris yang sudah dihapus di server.
+    Tanpa state (tabel tidak mendukung sync) -> fallback ke full_load.
+    """
+    pk = TABLE_PRIMARY_KEYS.get(table_name)
+    if not state or pk is None or pk not in df.columns:
+        return full_load(client, table_name, columns)
+
+    now = time.time()
+    reconcile_due = now - state["reconciled_at"] > RECONCILE_INTERVAL
+    if reconcile_due and state["column"] == pk:
+        # Mode pk-only tidak bisa melihat UPDATE -> sesekali reload penuh
+        return full_load(client, table_name, columns)
+
+    column, mark = state["column"], state["hwm"]
+    new_mark = column_bound(client, table_name, column, desc=True)
+    if new_mark is not None and new_mark != mark:
+        filters = [("gt", column, mark)] if mark is not None else []
+        pages = walk_key_range(
+            client, table_name, pk,
+            columns=",".join(_frame_columns(columns, pk) or ["*"]),
+            filters=filters,
+        )
+        delta = apply_schema(pages_to_frame(pages, list(df.columns)), table_name)
+        df = upsert_rows(df, delta, pk, table_name)
+
+    reconciled_at = state["reconciled_at"]
+    if reconcile_due or head_count(client, table_name) != len(df):
+        present = df[pk].isin(_remote_keys(client, table_name, pk))
+        if not present.all():
+            df = df[present].reset_index(drop=True)
+        reconciled_at = now
+
+    return df, {"column": column, "hwm": new_mark if new_mark is not None else mark,
+                "reconciled_at": reconciled_at}
@@ -0,0 +1,99 @@
+"""
+Transport HTTP ke PostgREST: pool koneksi keep-alive, timeout, retry dengan jitter
+
+Session bawaan postgrest-py memakai httpx.Client default (tanpa batas pool
+eksplisit, tanpa retry). make_session() menggantinya dengan satu client
+bersama untuk seluruh proses:
+- pool koneksi keep-alive (HTTP/2 kalau paket h2 terpasang)
+- body response gzip (Accept-Encoding bawaan httpx, didekompresi otomatis)
+- timeout connect / read per request
+- retry untuk error jaringan & 429/502/503/504, backoff eksponensial full jitter
+"""
+
+import os
+import random
+import time
+
+import httpx
+from postgrest.utils import SyncClient
+
+from meteor.perf import perf, record_response
+
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# Timeout per request (detik): connect singkat, read cukup untuk halaman 1000 baris
+HTTP_TIMEOUT = httpx.Timeout(float(os.getenv("METEOR_HTTP_TIMEOUT", "30")), connect=5.0)
+# Prefetch (6 thread) x key-range walker (4 thread) bisa jalan bersamaan
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60)
+
+RETRY_ATTEMPTS = int(os.getenv("METEOR_HTTP_RETRIES", "3"))
+RETRY_BACKOFF = 0.25
+RETRY_BACKOFF_MAX = 4.0
+RETRY_STATUS = (429, 502, 503, 504)
+
+
+def _idempotent(request):
+    """GET/HEAD selalu aman diulang; POST hanya untuk RPC read-only (/rpc/...)"""
+    if request.method in ("GET", "HEAD"):
+        return True
+    return request.method == "POST" and "/rpc/" in request.url.path
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Bungkus transport lain; ulangi request idempotent yang gagal sementara"""
+
+    def __init__(self, transport, attempts=RETRY_ATTEMPTS, backoff=RETRY_BACKOFF, backoff_max=RETRY_BACKOFF_MAX):
+        self.transport = transport
+        self.attempts = attempts
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+
+    def delay(self, attempt, retry_after=None):
+        """Full jitter: acak 0..backoff * 2**attempt (Retry-After server diutamakan)"""
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt))
+
+    def handle_request(self, request):
+        retryable = _idempotent(request)
+        attempt = 0
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError:
+                if not retryable or attempt >= self.attempts:
+                    raise
+                wait = self.delay(attempt)
+            else:
+                if response.status_code not in RETRY_STATUS or not retryable or attempt >= self.attempts:
+                    return response
+                wait = self.delay(attempt, response.headers.get("retry-after"))
+                response.close()
+            perf.incr("http_retries")
+            time.sleep(wait)
+            attempt += 1
+
+    def close(self):
+        self.transport.close()
+
+
+def make_session(base_url, headers, transport=None):
+    """
+    Client httpx untuk client.postgrest.session. transport=None -> koneksi
+    jaringan sungguhan dengan pool; transport lain (mis. MockTransport dari
+    meteor.fake) tetap dibungkus retry supaya jalurnya sama.
+    """
+    if transport is None:
+        transport = httpx.HTTPTransport(limits=HTTP_LIMITS, http2=HTTP2)
+    return SyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=HTTP_TIMEOUT,
+        transport=RetryTransport(transport),
+        # Counter request & byte untuk panel performance (meteor.perf)
+        event_hooks={"response": [record_response]},
+    )
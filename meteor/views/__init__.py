@@ -0,0 +1,25 @@
+"""
+Halaman dashboard, satu modul per halaman
+
+Modul halaman di-import lazy saat pertama kali dibuka. Setiap modul punya
+TABLES / COUNTS / CHARTS (data yang di-prefetch) dan render(data, counts, charts).
+Bagian yang punya widget sendiri (filter, globe, heatmap) memakai st.fragment,
+jadi interaksi di sana tidak menjalankan ulang seluruh app.
+"""
+
+import importlib
+
+# Label navigasi -> nama modul di meteor.views
+PAGES = {
+    "🏠 Home": "home",
+    "☄️ Meteorites": "meteorites",
+    "🔬 Classifications": "classifications",
+    "🏛️ Museums": "museums",
+    "📚 Research": "research",
+    "🌍 Globe Map": "globe",
+}
+
+
+def load_page(label):
+    """Import modul halaman (sekali per proses, sesudahnya dari sys.modules)"""
+    return importlib.import_module(f"meteor.views.{PAGES[label]}")
@@ -0,0 +1,70 @@
+"""
+🔬 Classifications: kategori & class group
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from meteor.figures import apply_meteor_theme, cached_figure, show_figure
+from meteor.snapshot import data_version
+
+# Data yang di-prefetch paralel sebelum halaman dirender (lihat meteor.data.prefetch)
+TABLES = ["meteorite_classifications"]
+COUNTS = []
+CHARTS = ["top_class_groups"]
+
+
+def render(data, counts, charts):
+    st.markdown("# 🔬 Meteorite Classifications")
+    
+    classifications = data["meteorite_classifications"]
+    
+    if not classifications.empty:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("📚 Total Classes", len(classifications))
+        with col2:
+            st.metric("📂 Groups", classifications["class_group"].nunique())
+        with col3:
+            st.metric("🏷️ Categories", classifications["category"].nunique())
+        
+        st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🌌 By Category")
+            def build():
+                cat_counts = classifications["category"].value_counts().reset_index()
+                cat_counts.columns = ["Category", "Count"]
+                fig = px.pie(cat_counts, values="Count", names="Category", hole=0.5,
+                           color_discrete_sequence=px.colors.sequential.Plasma)
+                fig = apply_meteor_theme(fig)
+                fig.update_traces(textfont_color='white')
+                return fig
+            fig = cached_figure("classifications_categories", (data_version(classifications),), build)
+            show_figure(fig)
+        
+        with col2:
+            st.markdown("### 📊 Top Class Groups")
+            group_counts = charts["top_class_groups"]
+            if not group_counts.empty:
+                def build():
+                    group_counts.columns = ["Group", "Count"]
+                    fig = px.bar(group_counts, x="Count", y="Group", orientation='h',
+                               color="Count", color_continuous_scale="Oranges")
+                    fig = apply_meteor_theme(fig)
+                    return fig
+                fig = cached_figure("classifications_top_groups", (data_version(group_counts),), build)
+                show_figure(fig)
+        
+        # Treemap
+        st.markdown("### 🗺️ Classification Hierarchy")
+        def build():
+            fig = px.treemap(classifications, path=['category', 'class_group'], 
+                            color_discrete_sequence=px.colors.sequential.Oranges)
+            fig = apply_meteor_theme(fig)
+            fig.update_layout(height=500)
+            return fig
+        fig = cached_figure("classifications_treemap", (data_version(classifications),), build)
+        show_figure(fig)
@@ -0,0 +1,291 @@
+"""
+🌍 Globe Map: globe 3D interaktif + density heatmap
+"""
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from meteor.binning import LATITUDE_BINS
+from meteor.data import filter_index, meteorite_facts, spatial_index
+from meteor.figures import apply_meteor_theme, cached_figure, show_figure
+from meteor.perf import perf
+from meteor.snapshot import data_version
+
+# Data yang di-prefetch paralel sebelum halaman dirender (lihat meteor.data.prefetch)
+TABLES = ["meteorites", "meteorite_classifications", "fall_types", "locations"]
+COUNTS = []
+CHARTS = []
+
+
+def render(data, counts, charts):
+    st.markdown("# 🌍 Interactive Globe Map")
+    st.markdown("### Explore Meteorite Landing Sites Around the World")
+    
+    locations = data["locations"]
+    meteorites = meteorite_facts(data)
+    
+    if not locations.empty and not meteorites.empty and "latitude" in meteorites.columns:
+        # Jumlah meteorit yang punya koordinat (fact table sudah membawa latitude/longitude)
+        total_available = len(spatial_index(meteorites))
+        st.success(f"📊 Total data dengan koordinat: **{total_available:,} lokasi meteorit**")
+        
+        # Globe & heatmap masing-masing fragment: slider-nya hanya menjalankan ulang bagiannya sendiri
+        globe_section(meteorites)
+        
+        st.markdown("---")
+        
+        # Statistics by terrain
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🏔️ By Terrain Type")
+            if "terrain_type" in locations.columns:
+                def build():
+                    terrain_counts = locations["terrain_type"].value_counts().reset_index()
+                    terrain_counts.columns = ["Terrain", "Count"]
+                    fig = px.bar(terrain_counts, x="Count", y="Terrain", orientation='h',
+                               color="Count", color_continuous_scale="Oranges")
+                    fig = apply_meteor_theme(fig)
+                    return fig
+                fig = cached_figure("globe_terrain", (data_version(locations),), build)
+                show_figure(fig)
+        
+        with col2:
+            st.markdown("### 🌍 Geographic Distribution")
+            # Latitude distribution
+            def build():
+                lat_counts = filter_index(meteorites).query().bin_counts("latitude", LATITUDE_BINS)
+                fig = px.bar(x=LATITUDE_BINS.edges[:-1] + 2.5, y=lat_counts.to_numpy(),
+                            color_discrete_sequence=["#ff6b35"],
+                            labels={"x": "Latitude", "y": "count"})
+                fig.update_traces(width=5)
+                fig = apply_meteor_theme(fig)
+                fig.update_layout(title="Latitude Distribution")
+                return fig
+            fig = cached_figure("globe_latitude", (data_version(meteorites),), build)
+            show_figure(fig)
+        
+        heatmap_section(meteorites)
+
+
+@st.fragment
+def globe_section(meteorites):
+    """Globe 3D (grid LOD), di-rerun sendiri saat budget titik berubah"""
+    # Budget titik di globe: grid LOD memilih level paling detail yang muat
+    index = spatial_index(meteorites)
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        max_points = st.slider(
+            "🎯 Maksimum Titik di Globe", 
+            min_value=100, 
+            max_value=5000,
+            value=1000,
+            step=100,
+            help="Meteorit yang berdekatan digabung jadi satu cluster (jumlah + total massa). Semakin besar = semakin detail, tapi semakin lambat."
+        )
+    with perf.timer("transform:globe_view"):
+        level, singles, groups = index.view(max_points)
+    with col2:
+        st.metric("Menampilkan", f"{len(singles) + len(groups):,}")
+    
+    # Header di luar globe
+    st.markdown("### ☄️ Meteorite Landing Sites - 3D Globe")
+    st.caption(
+        f"Grid {180 / 2 ** level:.2f}° · {len(singles):,} meteorit individual · "
+        f"{len(groups):,} cluster berisi {int(groups['count'].sum()):,} meteorit"
+    )
+    
+    # Meteorit yang dipilih dari pencarian nama (halaman Meteorites)
+    focus = st.session_state.get("globe_focus")
+    if focus:
+        col_focus, col_clear = st.columns([3, 1])
+        with col_focus:
+            st.info(f"🎯 Fokus: **{focus['name']}** ({focus['latitude']:.2f}°, {focus['longitude']:.2f}°)")
+        with col_clear:
+            st.button("✖️ Hapus fokus", on_click=st.session_state.pop, args=("globe_focus", None))
+    
+    def build():
+        # 3D Globe using Plotly
+        fig = go.Figure()
+    
+        # Cluster: lingkaran dengan ukuran ~ sqrt(jumlah meteorit)
+        fig.add_trace(go.Scattergeo(
+            lon=groups["longitude"],
+            lat=groups["latitude"],
+            customdata=groups[["count", "total_mass"]].values,
+            hovertemplate=(
+                "<b style='font-size:16px; color:#ff6b35;'>☄️ %{customdata[0]:,} meteorit</b><br>"
+                "<br>"
+                "⚖️ <b>Total massa:</b> %{customdata[1]:,.0f} g<br>"
+                "📍 <b>Pusat cluster:</b><br>"
+                "   Lat: %{lat:.2f}°<br>"
+                "   Lon: %{lon:.2f}°"
+                "<extra></extra>"
+            ),
+            mode='markers',
+            marker=dict(
+                size=np.clip(np.sqrt(groups["count"].to_numpy()) * 4, 6, 40),
+                color='rgba(255, 107, 53, 0.55)',
+                line=dict(color='#ffb38a', width=1)
+            ),
+            showlegend=False
+        ))
+    
+        # Meteorit individual dengan emoji ☄️ dan hover detail. Massa dikirim
+        # sebagai angka & diformat oleh hovertemplate; meteorit tanpa massa
+        # memakai trace sendiri dengan label konstan "Unknown".
+        mass_labels = {
+            True: "%{customdata[1]:,.2f} g (%{customdata[2]:,.2f} kg)",
+            False: "Unknown",
+        }
+        for known, mass_label in mass_labels.items():
+            points = singles[singles["mass_known"].to_numpy() == known]
+            fig.add_trace(go.Scattergeo(
+                lon=points["longitude"],
+                lat=points["latitude"],
+                text=["☄️"] * len(points),  # Emoji meteor sebagai label
+                # Data lengkap untuk hover
+                customdata=points[['name', 'mass_gram', 'mass_kg', 'year_display', 'latitude', 'longitude']].values,
+                hovertemplate=(
+                    "<b style='font-size:16px; color:#ff6b35;'>☄️ %{customdata[0]}</b><br>"
+                    "<br>"
+                    f"⚖️ <b>Massa:</b> {mass_label}<br>"
+                    "📅 <b>Tahun:</b> %{customdata[3]}<br>"
+                    "📍 <b>Koordinat:</b><br>"
+                    "   Lat: %{customdata[4]:.2f}°<br>"
+                    "   Lon: %{customdata[5]:.2f}°"
+                    "<extra></extra>"
+                ),
+                mode='text',
+                textfont=dict(
+                    size=14,
+                    color='#ff6b35'
+                ),
+                showlegend=False
+            ))
+    
+        if focus:
+            # Penanda meteorit hasil pencarian
+            fig.add_trace(go.Scattergeo(
+                lon=[focus["longitude"]],
+                lat=[focus["latitude"]],
+                text=[focus["name"]],
+                hovertemplate="<b style='font-size:16px; color:#ffe66d;'>🎯 %{text}</b><extra></extra>",
+                mode='markers+text',
+                textposition='top center',
+                textfont=dict(size=14, color='#ffe66d'),
+                marker=dict(size=18, symbol='star', color='#ffe66d', line=dict(color='#ff6b35', width=2)),
+                showlegend=False
+            ))
+    
+        # Globe layout (tanpa title di dalam)
+        fig.update_layout(
+            geo=dict(
+                projection_type='orthographic',  # 3D Globe!
+                showland=True,
+                landcolor='rgb(40, 40, 80)',
+                showocean=True,
+                oceancolor='rgb(20, 20, 50)',
+                showlakes=True,
+                lakecolor='rgb(30, 30, 60)',
+                showcountries=True,
+                countrycolor='rgb(100, 100, 150)',
+                showcoastlines=True,
+                coastlinecolor='rgb(80, 80, 120)',
+                bgcolor='rgba(10, 10, 26, 1)',
+                # Globe diputar menghadap meteorit fokus (kalau ada)
+                projection_rotation=(
+                    dict(lon=focus["longitude"], lat=focus["latitude"], roll=0) if focus
+                    else dict(lon=0, lat=20, roll=0)
+                )
+            ),
+            paper_bgcolor='rgba(10, 10, 26, 1)',
+            plot_bgcolor='rgba(10, 10, 26, 1)',
+            height=700,
+            margin=dict(l=0, r=0, t=0, b=0)
+        )
+    
+        return fig
+    focus_id = focus["meteorite_id"] if focus else None
+    fig = cached_figure("globe_markers", (data_version(meteorites), max_points, focus_id), build)
+    show_figure(fig)
+    
+    # Instruksi interaksi di bawah globe
+    st.markdown("""
+    <p style="text-align: center; color: #a0a0ff;">
+    🖱️ <b>Drag to rotate</b> | 🔍 <b>Scroll to zoom</b> | 👆 <b>Hover ☄️ untuk detail</b>
+    </p>
+    """, unsafe_allow_html=True)
+
+
+@st.fragment
+def heatmap_section(meteorites):
+    """Density heatmap, di-rerun sendiri saat mode / resolusi / radius / zoom berubah"""
+    # Heatmap density
+    st.markdown("### 🔥 Density Heatmap")
+    
+    # Opsi heatmap mode
+    col_heat1, col_heat2, col_heat3 = st.columns([2, 2, 2])
+    with col_heat1:
+        heatmap_mode = st.radio(
+            "📊 Mode Heatmap:",
+            ["🔢 Berdasarkan Jumlah", "⚖️ Berdasarkan Massa"],
+            help="Jumlah = semua meteorit sama intensitasnya | Massa = meteorit besar lebih terang"
+        )
+        grid_size = st.select_slider(
+            "🧮 Resolusi Grid", options=[0.5, 1.0, 2.0], value=1.0,
+            format_func=lambda size: f"{size:g}°"
+        )
+        smooth_heat = st.checkbox("🌫️ Haluskan (Gaussian)", value=False)
+    with col_heat2:
+        radius_heat = st.slider("🎯 Radius Titik", 5, 50, 25, step=5)
+    with col_heat3:
+        zoom_heat = st.slider("🔍 Zoom Level", 0, 3, 1)
+    
+    index = spatial_index(meteorites)
+    # Semua lokasi di-bin jadi grid (di-cache per mode/resolusi), yang dikirim
+    # ke browser hanya sel grid -> ukuran payload tetap, tidak tergantung jumlah data
+    if heatmap_mode == "🔢 Berdasarkan Jumlah":
+        weights, colorscale_heat = "count", 'Hot'
+    else:
+        # Berdasarkan massa: jumlah log10(massa + 1) per sel
+        weights, colorscale_heat = "log_mass", 'Plasma'
+    
+    def build():
+        grid = index.density_grid(grid_size, weights, sigma=1.0 if smooth_heat else 0.0)
+        fig = go.Figure(go.Densitymapbox(
+            lat=grid["latitude"],
+            lon=grid["longitude"],
+            z=grid["z"],
+            radius=radius_heat,  # Dinamis dari slider
+            colorscale=colorscale_heat,
+            showscale=True,
+            colorbar=dict(
+                title="Intensitas" if heatmap_mode == "🔢 Berdasarkan Jumlah" else "Log(Mass)",
+                titlefont=dict(color='#d0d0ff'),
+                tickfont=dict(color='#d0d0ff')
+            )
+        ))
+    
+        fig.update_layout(
+            mapbox=dict(
+                style='carto-darkmatter',
+                center=dict(lat=20, lon=0),
+                zoom=zoom_heat  # Dinamis dari slider
+            ),
+            height=600,
+            margin=dict(l=0, r=0, t=0, b=0),
+            paper_bgcolor='rgba(10, 10, 26, 1)'
+        )
+        return fig
+    heatmap_key = (data_version(meteorites), weights, grid_size, smooth_heat, radius_heat, zoom_heat)
+    fig = cached_figure("globe_heatmap", heatmap_key, build)
+    show_figure(fig)
+    
+    # Penjelasan
+    if heatmap_mode == "🔢 Berdasarkan Jumlah":
+        st.info("💡 **Mode Jumlah**: Semua meteorit memiliki intensitas yang sama. Area dengan banyak meteorit akan terlihat lebih terang.")
+    else:
+        st.info("💡 **Mode Massa**: Meteorit dengan massa lebih besar akan terlihat lebih terang (skala logaritmik).")
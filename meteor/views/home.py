@@ -0,0 +1,110 @@
+"""
+🏠 Home: ringkasan koleksi meteorit
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from meteor.figures import apply_meteor_theme, cached_figure, show_figure
+from meteor.snapshot import data_version
+
+# Data yang di-prefetch paralel sebelum halaman dirender (lihat meteor.data.prefetch)
+TABLES = ["meteorite_classifications", "museums"]
+COUNTS = ["meteorites", "meteorite_specimens", "research_studies"]
+CHARTS = ["meteorite_categories", "fall_vs_found", "discovery_timeline", "mass_statistics"]
+
+
+def render(data, counts, charts):
+    st.markdown('<p class="meteor-header">☄️ METEORITE EXPLORER</p>', unsafe_allow_html=True)
+    st.markdown("<h3 style='text-align: center; color: #a0a0ff;'>Explore the Universe of Fallen Stars</h3>", unsafe_allow_html=True)
+    
+    classifications = data["meteorite_classifications"]
+    museums = data["museums"]
+    
+    st.markdown("---")
+    
+    # Animated metrics
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("☄️ Meteorites", f"{counts['meteorites']:,}")
+    with col2:
+        st.metric("🔬 Classifications", len(classifications))
+    with col3:
+        st.metric("🏛️ Museums", len(museums))
+    with col4:
+        st.metric("💎 Specimens", f"{counts['meteorite_specimens']:,}")
+    with col5:
+        st.metric("📚 Studies", f"{counts['research_studies']:,}")
+    
+    st.markdown("---")
+    
+    # Main charts
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🌌 Meteorite Categories")
+        # Agregasi di server (view chart_meteorite_categories), NULL sudah dibuang
+        cat_counts = charts["meteorite_categories"]
+        if not cat_counts.empty:
+            def build():
+                cat_counts.columns = ["Category", "Count"]
+                fig = px.pie(cat_counts, values="Count", names="Category", hole=0.5,
+                           color_discrete_sequence=px.colors.sequential.Oranges_r)
+                fig = apply_meteor_theme(fig)
+                fig.update_traces(textfont_color='white', textinfo='percent+label')
+                return fig
+            fig = cached_figure("home_categories", (data_version(cat_counts),), build)
+            show_figure(fig)
+    
+    with col2:
+        st.markdown("### 🔥 Fall vs Found")
+        fall_counts = charts["fall_vs_found"]
+        if not fall_counts.empty:
+            def build():
+                fall_counts.columns = ["Type", "Count"]
+                fig = px.pie(fall_counts, values="Count", names="Type", hole=0.5,
+                           color_discrete_sequence=["#ff6b35", "#4ecdc4"])
+                fig = apply_meteor_theme(fig)
+                fig.update_traces(textfont_color='white', textinfo='percent+label')
+                return fig
+            fig = cached_figure("home_fall_vs_found", (data_version(fall_counts),), build)
+            show_figure(fig)
+    
+    # Timeline
+    st.markdown("### 📅 Discovery Timeline")
+    yearly = charts["discovery_timeline"]
+    if not yearly.empty:
+        def build():
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=yearly["year_discovered"], y=yearly["count"],
+                mode='lines', fill='tozeroy',
+                line=dict(color='#ff6b35', width=2),
+                fillcolor='rgba(255, 107, 53, 0.3)'
+            ))
+            fig = apply_meteor_theme(fig)
+            fig.update_layout(
+                xaxis_title="Year",
+                yaxis_title="Discoveries",
+                height=400
+            )
+            return fig
+        fig = cached_figure("home_timeline", (data_version(yearly),), build)
+        show_figure(fig)
+    
+    # Mass stats
+    st.markdown("### ⚖️ Mass Statistics")
+    mass_stats = charts["mass_statistics"]
+    if not mass_stats.empty and pd.notna(mass_stats["total_mass"].iloc[0]):
+        stats = mass_stats.iloc[0]
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("🌍 Total Mass", f"{stats['total_mass'] / 1000000:,.1f} tons")
+        with col2:
+            st.metric("📊 Average", f"{stats['avg_mass']:,.0f} g")
+        with col3:
+            st.metric("🏆 Largest", f"{stats['max_mass'] / 1000:,.0f} kg")
+        with col4:
+            st.metric("🔬 Smallest", f"{stats['min_mass']:.4f} g")
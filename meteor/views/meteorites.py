@@ -0,0 +1,271 @@
+"""
+☄️ Meteorites: database meteorit dengan filter
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from meteor.data import aggregate_cube, filter_index, meteorite_facts, name_index
+from meteor.figures import apply_meteor_theme, cached_figure, show_figure
+from meteor.perf import perf
+from meteor.snapshot import data_version
+from meteor.views import PAGES
+
+# Data yang di-prefetch paralel sebelum halaman dirender (lihat meteor.data.prefetch)
+TABLES = ["meteorites", "meteorite_classifications", "fall_types", "locations"]
+COUNTS = []
+CHARTS = []
+
+# Tabel data: pilihan urutan (label -> kolom fact table) & ukuran halaman
+TABLE_COLUMNS = ["meteorite_id", "name", "mass_gram", "year_discovered"]
+SORT_COLUMNS = {"Mass": "mass_gram", "Year": "year_discovered", "Name": "name", "ID": "meteorite_id"}
+PAGE_SIZES = [50, 100, 250, 500]
+
+# Pencarian nama: jumlah hasil & kolom yang ditampilkan
+SEARCH_LIMIT = 20
+SEARCH_COLUMNS = ["meteorite_id", "name", "category", "fall_type_name", "year_discovered", "mass_gram",
+                  "latitude", "longitude"]
+# Batas slider Year Range & nilai awalnya
+YEAR_BOUNDS = (800, 2023)
+DEFAULT_YEARS = (1900, 2023)
+# Label navigasi halaman globe (tujuan tombol "Show on globe")
+GLOBE_PAGE = next(label for label, module in PAGES.items() if module == "globe")
+
+
+def render(data, counts, charts):
+    st.markdown("# ☄️ Meteorite Database")
+    
+    # Fact table bersama (sudah berisi category, class_group, fall_type_name)
+    meteorites = meteorite_facts(data)
+    classifications = data["meteorite_classifications"]
+    fall_types = data["fall_types"]
+    
+    categories = ["All"]
+    if not classifications.empty:
+        categories += sorted(classifications["category"].dropna().unique().tolist())
+    falls = ["All"]
+    if not fall_types.empty:
+        falls += fall_types["fall_type_name"].tolist()
+    
+    search_section(meteorites, categories, falls)
+    filtered_section(meteorites, categories, falls)
+
+
+def _show_in_filters(record, categories, falls):
+    """Callback: set filter (category, fall type, tahun) ke milik meteorit hasil pencarian"""
+    category, fall = record.get("category"), record.get("fall_type_name")
+    st.session_state["filter_category"] = category if category in categories else "All"
+    st.session_state["filter_fall"] = fall if fall in falls else "All"
+    year = record.get("year_discovered")
+    if pd.notna(year) and YEAR_BOUNDS[0] <= year <= YEAR_BOUNDS[1]:
+        st.session_state["filter_years"] = (int(year), int(year))
+    else:
+        st.session_state["filter_years"] = YEAR_BOUNDS
+    st.session_state["search_jump"] = True
+
+
+def _show_on_globe(record):
+    """Callback: fokuskan globe ke meteorit hasil pencarian lalu pindah ke halaman globe"""
+    st.session_state["globe_focus"] = {
+        "meteorite_id": record["meteorite_id"],
+        "name": record["name"],
+        "latitude": float(record["latitude"]),
+        "longitude": float(record["longitude"]),
+    }
+    st.session_state["page"] = GLOBE_PAGE
+    st.session_state["search_jump"] = True
+
+
+@st.fragment
+def search_section(meteorites, categories, falls):
+    """
+    Cari nama lewat NameIndex (prefix + trigram, tahan salah ketik), bukan
+    str.contains atas seluruh fact table. Hasil bisa dibuka di filter & tabel
+    di bawah atau di globe.
+    """
+    st.markdown("### 🔎 Search by Name")
+    query = st.text_input(
+        "Search by name", placeholder="Allende, Murchison, sikhote alin ...",
+        label_visibility="collapsed"
+    )
+    if not query.strip():
+        return
+    
+    with perf.timer("transform:name_search"):
+        hits = name_index(meteorites).search(query, SEARCH_LIMIT)
+        found = filter_index(meteorites).take(hits["row"].to_numpy(), SEARCH_COLUMNS).reset_index(drop=True)
+    if found.empty:
+        st.info(f"Tidak ada nama meteorit yang mirip '{query}'")
+        return
+    
+    found.insert(0, "match", hits["score"].to_numpy())
+    st.dataframe(
+        found.drop(columns=["latitude", "longitude"], errors="ignore"),
+        use_container_width=True, hide_index=True,
+        column_config={"match": st.column_config.ProgressColumn("Match", min_value=0, max_value=1, format="%.2f")}
+    )
+    
+    col_pick, col_filter, col_globe = st.columns([2, 1, 1])
+    with col_pick:
+        picked = st.selectbox("Meteorite", range(len(found)), format_func=lambda i: found["name"].iat[i])
+    record = found.iloc[picked].to_dict()
+    with col_filter:
+        st.button("🎯 Show in filters & table", on_click=_show_in_filters, args=(record, categories, falls),
+                  use_container_width=True)
+    with col_globe:
+        located = pd.notna(record.get("latitude")) and pd.notna(record.get("longitude"))
+        st.button("🌍 Show on globe", on_click=_show_on_globe, args=(record,), disabled=not located,
+                  use_container_width=True)
+    
+    # Tombol di atas mengubah widget di luar fragment ini -> rerun seluruh app
+    # (setelah semua widget fragment dirender, supaya nilainya tidak hilang)
+    if st.session_state.pop("search_jump", False):
+        st.rerun()
+
+
+@st.fragment
+def filtered_section(meteorites, categories, falls):
+    """
+    Filter + semua hasilnya dalam satu fragment: mengubah filter hanya
+    menjalankan ulang fungsi ini, bukan seluruh app.
+    (Widget di dalam fragment tidak boleh ke sidebar, jadi filter ada di halaman.)
+    """
+    st.markdown("### 🎯 Filters")
+    col_cat, col_fall, col_year = st.columns([1, 1, 2])
+    with col_cat:
+        selected_cat = st.selectbox("Category", categories, key="filter_category")
+    with col_fall:
+        selected_fall = st.selectbox("Fall Type", falls, key="filter_fall")
+    with col_year:
+        # Nilai awal lewat session state (bisa di-set dari hasil pencarian nama)
+        st.session_state.setdefault("filter_years", DEFAULT_YEARS)
+        year_range = st.slider("Year Range", *YEAR_BOUNDS, key="filter_years")
+    
+    with perf.timer("transform:filter_query"):
+        # Jumlah, grup & statistik massa dari aggregate cube (biaya ~ jumlah sel)
+        summary = aggregate_cube(meteorites).query(
+            year_range, category=selected_cat, fall_type_name=selected_fall
+        )
+        # Baris individual (top 15, tabel) lewat index (tahun terurut + bitmap kategori)
+        result = filter_index(meteorites).query(
+            year_range, category=selected_cat, fall_type_name=selected_fall
+        )
+    # Kunci figure cache: data version fact table + nilai filter
+    filter_key = (data_version(meteorites), year_range, selected_cat, selected_fall)
+    
+    st.metric("🎯 Filtered Results", f"{len(summary):,}")
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📊 By Classification Group")
+        if not summary.empty and "class_group" in meteorites.columns:
+            def build():
+                group_counts = summary.value_counts("class_group").head(10).reset_index()
+                group_counts.columns = ["Group", "Count"]
+                fig = px.bar(group_counts, x="Count", y="Group", orientation='h',
+                           color="Count", color_continuous_scale="Oranges")
+                return apply_meteor_theme(fig)
+            fig = cached_figure("meteorites_groups", filter_key, build)
+            show_figure(fig)
+    
+    with col2:
+        st.markdown("### ⚖️ Mass Distribution")
+        if not summary.empty and "mass_gram" in meteorites.columns:
+            n_mass, _, mean_mass, max_mass = summary.mass_stats()
+            
+            if n_mass > 0:
+                # Statistik ringkas
+                col_a, col_b, col_c = st.columns(3)
+                with col_a:
+                    st.metric("📊 Total", f"{n_mass:,}")
+                with col_b:
+                    st.metric("⚖️ Rata-rata", f"{mean_mass/1000:,.1f} kg")
+                with col_c:
+                    st.metric("🏆 Terberat", f"{max_mass/1000:,.0f} kg")
+                
+                def build():
+                    # Jumlah per kategori massa (dimensi bin massa di cube)
+                    category_counts = summary.mass_counts().reset_index()
+                    category_counts.columns = ['Kategori', 'Jumlah']
+                
+                    # Buat bar chart dengan warna gradasi
+                    colors = ['#4ecdc4', '#45b7aa', '#3da58a', '#ff6b35', '#e74c3c']
+                
+                    fig = go.Figure()
+                    fig.add_trace(go.Bar(
+                        x=category_counts['Kategori'],
+                        y=category_counts['Jumlah'],
+                        marker=dict(
+                            color=colors,
+                            line=dict(color='rgba(255, 255, 255, 0.3)', width=1.5)
+                        ),
+                        text=category_counts['Jumlah'],
+                        textposition='outside',
+                        textfont=dict(size=12, color='#d0d0ff')
+                    ))
+                
+                    fig = apply_meteor_theme(fig)
+                    fig.update_layout(
+                        xaxis_title="Kategori Massa",
+                        yaxis_title="Jumlah Meteorit",
+                        showlegend=False,
+                        height=350,
+                        xaxis=dict(tickangle=0)
+                    )
+                    return fig
+                fig = cached_figure("meteorites_mass_bins", filter_key, build)
+                show_figure(fig)
+            else:
+                st.warning("⚠️ Tidak ada data massa")
+    
+    # Top heaviest
+    st.markdown("### 🏆 Top 15 Heaviest Meteorites")
+    if not result.empty and "mass_gram" in meteorites.columns:
+        def build():
+            # Telusuri permutasi massa menurun (index) sampai 15 baris lolos filter
+            top15 = result.top("mass_gram", 15, ["name", "mass_gram", "year_discovered"])
+            top15["mass_tons"] = top15["mass_gram"] / 1000000
+            fig = px.bar(top15, x="name", y="mass_tons", color="mass_tons",
+                        color_continuous_scale="YlOrRd",
+                        labels={"mass_tons": "Mass (tons)", "name": ""})
+            fig = apply_meteor_theme(fig)
+            fig.update_layout(xaxis_tickangle=-45)
+            return fig
+        fig = cached_figure("meteorites_top15", filter_key, build)
+        show_figure(fig)
+    
+    # Data table
+    st.markdown("### 📋 Data Table")
+    if not result.empty:
+        data_table(result)
+
+
+@st.fragment
+def data_table(result):
+    """
+    Tabel per halaman. Urutan & filter dijawab index lokal (permutasi per kolom),
+    hanya baris satu halaman yang dijadikan DataFrame. Ganti halaman / urutan
+    hanya menjalankan ulang fragment ini.
+    """
+    total = len(result)
+    col_sort, col_dir, col_size, col_page = st.columns([2, 1, 1, 1])
+    with col_sort:
+        sort_label = st.selectbox("Sort by", list(SORT_COLUMNS))
+    with col_dir:
+        descending = st.toggle("Descending", value=True)
+    with col_size:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1)
+    pages = max(1, -(-total // page_size))
+    with col_page:
+        # Label ikut jumlah halaman -> filter baru = widget baru, kembali ke halaman 1
+        page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1, step=1)
+    
+    start = (page - 1) * page_size
+    stop = min(start + page_size, total)
+    page_df = result.page(SORT_COLUMNS[sort_label], start, stop, descending, TABLE_COLUMNS)
+    st.caption(f"Rows {start + 1:,}–{stop:,} of {total:,}")
+    st.dataframe(page_df, use_container_width=True, height=400)
@@ -0,0 +1,93 @@
+"""
+🏛️ Museums: koleksi spesimen per museum
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from meteor.cards import card_list, card_text
+from meteor.figures import apply_meteor_theme, cached_figure, show_figure
+from meteor.snapshot import data_version
+
+# Data yang di-prefetch paralel sebelum halaman dirender (lihat meteor.data.prefetch)
+TABLES = ["museums"]
+COUNTS = ["meteorite_specimens"]
+CHARTS = ["specimens_by_museum", "specimen_types", "specimen_conditions", "specimen_mass"]
+
+
+def render(data, counts, charts):
+    st.markdown("# 🏛️ Museums & Collections")
+    
+    museums = data["museums"]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🏛️ Museums", len(museums))
+    with col2:
+        st.metric("💎 Specimens", f"{counts['meteorite_specimens']:,}")
+    with col3:
+        specimen_mass = charts["specimen_mass"]
+        if not specimen_mass.empty:
+            total = specimen_mass["total_mass"].fillna(0).iloc[0]
+            st.metric("⚖️ Total Mass", f"{total/1000:,.1f} kg")
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📊 Specimens by Museum")
+        museum_counts = charts["specimens_by_museum"]
+        if not museum_counts.empty:
+            def build():
+                museum_counts.columns = ["Museum", "Specimens"]
+                fig = px.bar(museum_counts, x="Specimens", y="Museum", orientation='h',
+                           color="Specimens", color_continuous_scale="Oranges")
+                fig = apply_meteor_theme(fig)
+                return fig
+            fig = cached_figure("museums_specimens", (data_version(museum_counts),), build)
+            show_figure(fig)
+    
+    with col2:
+        st.markdown("### 💎 Specimen Types")
+        type_counts = charts["specimen_types"]
+        if not type_counts.empty:
+            def build():
+                type_counts.columns = ["Type", "Count"]
+                fig = px.pie(type_counts, values="Count", names="Type", hole=0.5,
+                           color_discrete_sequence=px.colors.sequential.Sunset)
+                fig = apply_meteor_theme(fig)
+                fig.update_traces(textfont_color='white')
+                return fig
+            fig = cached_figure("museums_specimen_types", (data_version(type_counts),), build)
+            show_figure(fig)
+    
+    # Condition gauge
+    st.markdown("### 📈 Specimen Conditions")
+    cond_counts = charts["specimen_conditions"]
+    if not cond_counts.empty:
+        def build():
+            cond_counts.columns = ["Condition", "Count"]
+            colors = {"Excellent": "#2ecc71", "Good": "#3498db", "Fair": "#f39c12", "Poor": "#e74c3c"}
+            fig = px.bar(cond_counts, x="Condition", y="Count", 
+                        color="Condition", color_discrete_map=colors)
+            fig = apply_meteor_theme(fig)
+            return fig
+        fig = cached_figure("museums_conditions", (data_version(cond_counts),), build)
+        show_figure(fig)
+    
+    # Museum cards
+    st.markdown("### 🏛️ Museum Directory")
+    if not museums.empty:
+        # Satu blok HTML per halaman (bukan satu expander per museum)
+        card_list("museums", museums, museum_cards)
+
+
+def museum_cards(museums):
+    """HTML kartu museum (nama bisa dibuka untuk kota & deskripsi), satu per baris"""
+    return (
+        "<div class='meteor-card'><details><summary>🏛️ " + card_text(museums, "museum_name") + "</summary>"
+        + "<p class='card-sub'>📍 <b>City:</b> " + card_text(museums, "city") + "</p>"
+        + "<p class='card-sub'>📝 <b>Description:</b> " + card_text(museums, "description") + "</p>"
+        + "</details></div>"
+    )
@@ -0,0 +1,194 @@
+"""
+📚 Research: studi, peneliti & ekspedisi
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from meteor.cards import card_list, card_text
+from meteor.figures import apply_meteor_theme, cached_figure, show_figure
+from meteor.snapshot import data_version
+
+# Data yang di-prefetch paralel sebelum halaman dirender (lihat meteor.data.prefetch)
+TABLES = ["research_studies", "researchers", "discovery_expeditions", "meteorite_discoveries"]
+COUNTS = ["research_studies", "meteorite_discoveries"]
+CHARTS = []
+
+
+def render(data, counts, charts):
+    st.markdown("# 📚 Research & Expeditions")
+    
+    studies = data["research_studies"]
+    researchers = data["researchers"]
+    expeditions = data["discovery_expeditions"]
+    discoveries = data["meteorite_discoveries"]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("📚 Studies", f"{counts['research_studies']:,}")
+    with col2:
+        st.metric("👨‍🔬 Researchers", len(researchers))
+    with col3:
+        st.metric("🏕️ Expeditions", len(expeditions))
+    with col4:
+        st.metric("🔍 Discoveries", f"{counts['meteorite_discoveries']:,}")
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📊 Study Status")
+        if not studies.empty and "status" in studies.columns:
+            def build():
+                status_counts = studies["status"].value_counts().reset_index()
+                status_counts.columns = ["Status", "Count"]
+                colors = {"Published": "#2ecc71", "In Review": "#f39c12", "Completed": "#3498db", "Ongoing": "#9b59b6"}
+                fig = px.pie(status_counts, values="Count", names="Status", hole=0.5,
+                           color="Status", color_discrete_map=colors)
+                fig = apply_meteor_theme(fig)
+                fig.update_traces(textfont_color='white')
+                return fig
+            fig = cached_figure("research_status", (data_version(studies),), build)
+            show_figure(fig)
+    
+    with col2:
+        st.markdown("### 📅 Publications Timeline")
+        if not studies.empty and "publication_year" in studies.columns:
+            def build():
+                yearly = studies.groupby("publication_year").size().reset_index(name="count")
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=yearly["publication_year"], y=yearly["count"],
+                    mode='lines+markers', line=dict(color='#ff6b35', width=3),
+                    marker=dict(size=8, color='#ff6b35')
+                ))
+                fig = apply_meteor_theme(fig)
+                return fig
+            fig = cached_figure("research_publications", (data_version(studies),), build)
+            show_figure(fig)
+    
+    # Top journals
+    st.markdown("### 📰 Top Journals")
+    if not studies.empty and "journal" in studies.columns:
+        def build():
+            journal_counts = studies["journal"].value_counts().reset_index()
+            journal_counts.columns = ["Journal", "Publications"]
+            fig = px.bar(journal_counts, x="Publications", y="Journal", orientation='h',
+                       color="Publications", color_continuous_scale="Oranges")
+            fig = apply_meteor_theme(fig)
+            return fig
+        fig = cached_figure("research_journals", (data_version(studies),), build)
+        show_figure(fig)
+    
+    # ===== BAGIAN BARU: METEORITE DISCOVERIES =====
+    st.markdown("---")
+    st.markdown("## 🔍 Meteorite Discoveries Analysis")
+    st.markdown("##### Analisis Penemuan Meteorit dari Ekspedisi")
+    
+    if not discoveries.empty:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🔬 Discovery Methods")
+            if "discovery_method" in discoveries.columns:
+                def build():
+                    method_counts = discoveries["discovery_method"].value_counts().reset_index()
+                    method_counts.columns = ["Method", "Count"]
+                    fig = px.pie(method_counts, values="Count", names="Method", hole=0.4,
+                               color_discrete_sequence=px.colors.sequential.Sunset)
+                    fig = apply_meteor_theme(fig)
+                    fig.update_traces(textfont_color='white', textinfo='percent+label')
+                    return fig
+                fig = cached_figure("research_discovery_methods", (data_version(discoveries),), build)
+                show_figure(fig)
+        
+        with col2:
+            st.markdown("### 📍 Find Context")
+            if "find_context" in discoveries.columns:
+                def build():
+                    context_counts = discoveries["find_context"].value_counts().reset_index()
+                    context_counts.columns = ["Context", "Count"]
+                    fig = px.bar(context_counts, x="Count", y="Context", orientation='h',
+                               color="Count", color_continuous_scale="Plasma")
+                    fig = apply_meteor_theme(fig)
+                    return fig
+                fig = cached_figure("research_find_context", (data_version(discoveries),), build)
+                show_figure(fig)
+        
+        # Discovery Timeline
+        st.markdown("### 📅 Discovery Timeline")
+        if "discovery_date" in discoveries.columns:
+            def build():
+                # Convert to datetime and extract year
+                years = pd.to_datetime(discoveries["discovery_date"], errors='coerce').dt.year
+                
+                # Filter valid years
+                valid_years = years.dropna()
+                if valid_years.empty:
+                    return None
+                
+                yearly_discoveries = valid_years.groupby(valid_years).size()
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=yearly_discoveries.index, 
+                    y=yearly_discoveries.values,
+                    mode='lines+markers',
+                    line=dict(color='#4ecdc4', width=3),
+                    marker=dict(size=8, color='#4ecdc4'),
+                    fill='tozeroy',
+                    fillcolor='rgba(78, 205, 196, 0.2)'
+                ))
+                fig = apply_meteor_theme(fig)
+                fig.update_layout(
+                    xaxis_title="Tahun",
+                    yaxis_title="Jumlah Penemuan",
+                    height=350
+                )
+                return fig
+            fig = cached_figure("research_discovery_timeline", (data_version(discoveries),), build)
+            if fig is not None:
+                show_figure(fig)
+        
+        # Discoveries per Expedition
+        st.markdown("### 🏕️ Top Expeditions by Discoveries")
+        if not expeditions.empty:
+            def build():
+                # Merge discoveries with expeditions
+                exp_disc = discoveries.merge(expeditions, on="expedition_id", how="left")
+                if "expedition_name" not in exp_disc.columns:
+                    return None
+                exp_counts = exp_disc["expedition_name"].value_counts().head(10).reset_index()
+                exp_counts.columns = ["Expedition", "Discoveries"]
+                
+                fig = px.bar(exp_counts, x="Discoveries", y="Expedition", orientation='h',
+                           color="Discoveries", 
+                           color_continuous_scale="Oranges",
+                           labels={"Expedition": "Nama Ekspedisi", "Discoveries": "Jumlah Penemuan"})
+                fig = apply_meteor_theme(fig)
+                fig.update_layout(height=400)
+                return fig
+            fig = cached_figure("research_expeditions", (data_version(discoveries), data_version(expeditions)), build)
+            if fig is not None:
+                show_figure(fig)
+    else:
+        st.info("📊 Data meteorite discoveries belum tersedia")
+    
+    st.markdown("---")
+    
+    # Researchers
+    st.markdown("### 👨‍🔬 Research Team")
+    if not researchers.empty:
+        # Satu blok HTML per halaman (bukan satu st.markdown per peneliti)
+        card_list("researchers", researchers, researcher_cards)
+
+
+def researcher_cards(researchers):
+    """HTML kartu peneliti, satu per baris"""
+    return (
+        "<div class='meteor-card'><h4>" + card_text(researchers, "name") + "</h4>"
+        + "<p class='card-sub'>🔬 " + card_text(researchers, "specialization") + "</p>"
+        + "<p class='card-note'>🏫 " + card_text(researchers, "institution") + "</p></div>"
+    )
@@ -0,0 +1,76 @@
+-- ============================================================================
+-- Chart views (generated: python -m meteor.aggregates > sql/chart_views.sql)
+-- Dibaca oleh meteor.data.fetch_chart; kalau view belum ada -> pandas lokal
+-- ============================================================================
+
+create or replace view public.chart_meteorite_categories with (security_invoker = on) as
+select category, count(*) as count
+from public.meteorites
+left join public.meteorite_classifications using (classification_id)
+where category is not null
+group by category
+order by count desc;
+grant select on public.chart_meteorite_categories to anon, authenticated;
+
+create or replace view public.chart_fall_vs_found with (security_invoker = on) as
+select fall_type_name, count(*) as count
+from public.meteorites
+left join public.fall_types using (fall_type_id)
+where fall_type_name is not null
+group by fall_type_name
+order by count desc;
+grant select on public.chart_fall_vs_found to anon, authenticated;
+
+create or replace view public.chart_discovery_timeline with (security_invoker = on) as
+select year_discovered, count(*) as count
+from public.meteorites
+where year_discovered is not null
+  and year_discovered > 1800
+group by year_discovered
+order by year_discovered;
+grant select on public.chart_discovery_timeline to anon, authenticated;
+
+create or replace view public.chart_mass_statistics with (security_invoker = on) as
+select sum(mass_gram) as total_mass, avg(mass_gram) as avg_mass, max(mass_gram) as max_mass, min(mass_gram) as min_mass
+from public.meteorites
+where mass_gram > 0;
+grant select on public.chart_mass_statistics to anon, authenticated;
+
+create or replace view public.chart_top_class_groups with (security_invoker = on) as
+select class_group, count(*) as count
+from public.meteorite_classifications
+where class_group is not null
+group by class_group
+order by count desc
+limit 12;
+grant select on public.chart_top_class_groups to anon, authenticated;
+
+create or replace view public.chart_specimens_by_museum with (security_invoker = on) as
+select museum_name, count(*) as count
+from public.meteorite_specimens
+left join public.museums using (museum_id)
+where museum_name is not null
+group by museum_name
+order by count desc;
+grant select on public.chart_specimens_by_museum to anon, authenticated;
+
+create or replace view public.chart_specimen_types with (security_invoker = on) as
+select specimen_type, count(*) as count
+from public.meteorite_specimens
+where specimen_type is not null
+group by specimen_type
+order by count desc;
+grant select on public.chart_specimen_types to anon, authenticated;
+
+create or replace view public.chart_specimen_conditions with (security_invoker = on) as
+select condition, count(*) as count
+from public.meteorite_specimens
+where condition is not null
+group by condition
+order by count desc;
+grant select on public.chart_specimen_conditions to anon, authenticated;
+
+create or replace view public.chart_specimen_mass with (security_invoker = on) as
+select sum(specimen_mass_gram) as total_mass
+from public.meteorite_specimens;
+grant select on public.chart_specimen_mass to anon, authenticated;
@@ -0,0 +1,37 @@
+-- ============================================================================
+-- table_counts: hitung beberapa tabel dalam satu round trip
+-- Dipakai oleh meteor.db.batch_counts (fallback: HEAD request per tabel)
+--
+--   select * from table_counts(array['meteorites', 'museums'], 'exact');
+--
+-- count_method = 'exact'                 -> count(*)
+-- count_method = 'planned' / 'estimated' -> pg_class.reltuples (statistik)
+-- ============================================================================
+create or replace function public.table_counts(
+    table_names text[],
+    count_method text default 'exact'
+)
+returns table (table_name text, row_count bigint)
+language plpgsql
+stable
+set search_path = public
+as $$
+declare
+    t text;
+begin
+    foreach t in array table_names loop
+        if count_method = 'exact' then
+            return query execute format(
+                'select %L::text, count(*)::bigint from public.%I', t, t
+            );
+        else
+            return query
+                select t, greatest(c.reltuples, 0)::bigint
+                from pg_class c
+                where c.oid = format('public.%I', t)::regclass;
+        end if;
+    end loop;
+end;
+$$;
+
+grant execute on function public.table_counts(text[], text) to anon, authenticated;